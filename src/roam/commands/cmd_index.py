@@ -9,15 +9,17 @@ from roam.output.formatter import to_json
 @click.command()
 @click.option('--force', is_flag=True, help='Force full reindex')
 @click.option('--verbose', is_flag=True, help='Show detailed warnings during indexing')
+@click.option('--workers', type=click.IntRange(min=1), default=None,
+              help='Processes used for parsing (default: one per CPU on large indexes)')
 @click.pass_context
-def index(ctx, force, verbose):
+def index(ctx, force, verbose, workers):
     """Build or rebuild the codebase index."""
     json_mode = ctx.obj.get('json') if ctx.obj else False
     from roam.index.indexer import Indexer
     from roam.db.connection import open_db, db_exists
     t0 = time.monotonic()
     indexer = Indexer()
-    indexer.run(force=force, verbose=verbose)
+    indexer.run(force=force, verbose=verbose, workers=workers)
     elapsed = time.monotonic() - t0
 
     if not json_mode:
@@ -82,6 +82,13 @@ CREATE TABLE IF NOT EXISTS graph_metrics (
     betweenness REAL DEFAULT 0
 );
 
+-- References extracted from each file (JSON list of reference dicts),
+-- reused to rebuild edges without re-parsing files that did not change
+CREATE TABLE IF NOT EXISTS file_references (
+    file_id INTEGER PRIMARY KEY REFERENCES files(id) ON DELETE CASCADE,
+    refs TEXT NOT NULL
+);
+
 CREATE TABLE IF NOT EXISTS clusters (
     symbol_id INTEGER PRIMARY KEY REFERENCES symbols(id) ON DELETE CASCADE,
     cluster_id INTEGER NOT NULL,
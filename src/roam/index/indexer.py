@@ -1,13 +1,20 @@
 """Orchestrates the full indexing pipeline."""
 
+import gc
+import json
 import os
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
 from pathlib import Path
 
 from roam.db.connection import open_db, find_project_root, get_db_path
 from roam.index.discovery import discover_files
-from roam.index.parser import parse_file, detect_language, extract_vue_template, scan_template_references
+from roam.index.parser import (
+    parse_file, detect_language, extract_vue_template, scan_template_references, parse_errors,
+)
 from roam.index.symbols import extract_symbols, extract_references
 from roam.index.relations import resolve_references, build_file_edges
 from roam.index.incremental import get_changed_files, file_hash
@@ -73,6 +80,177 @@ def _log(msg: str):
     print(msg, file=sys.stderr)
 
 
+# Below this many files, worker start-up costs more than parallel parsing saves
+_PARALLEL_MIN_FILES = 200
+
+
+def _extract_file(root: Path, rel_path: str, verbose: bool = False) -> dict | None:
+    """Read, parse, and extract symbols/references for a single file.
+
+    Touches neither the database nor any shared state, so it can run in a
+    worker process.  Returns None if the file could not be read.
+    """
+    full_path = root / rel_path
+    language = detect_language(rel_path)
+
+    # Read source for metadata
+    try:
+        with open(full_path, "rb") as f:
+            source = f.read()
+    except OSError as e:
+        if verbose:
+            _log(f"  Warning: Could not read {rel_path}: {e}")
+        return None
+
+    try:
+        mtime = full_path.stat().st_mtime
+    except OSError:
+        mtime = None
+    result = {
+        "language": language,
+        "hash": file_hash(full_path),
+        "mtime": mtime,
+        "line_count": _count_lines(source),
+        "complexity": _compute_complexity(source),
+        "symbols": [],
+        "references": [],
+    }
+
+    # Parse with tree-sitter
+    tree, parsed_source, lang = parse_file(full_path, language)
+    if tree is None:
+        return result
+
+    # Get language extractor
+    get_extractor = _try_import_get_extractor()
+    extractor = None
+    if get_extractor is not None and lang is not None:
+        try:
+            extractor = get_extractor(lang)
+        except Exception as e:
+            if verbose:
+                _log(f"  Warning: No extractor for {lang}: {e}")
+            extractor = None
+
+    if extractor is None:
+        return result
+
+    # Extract symbols
+    symbols = extract_symbols(tree, parsed_source, rel_path, extractor)
+    result["symbols"] = symbols
+
+    # Extract references
+    all_references = result["references"]
+    refs = extract_references(tree, parsed_source, rel_path, extractor)
+    for ref in refs:
+        ref["source_file"] = rel_path
+    all_references.extend(refs)
+
+    # Vue template scanning: find identifiers in <template> that
+    # reference <script setup> bindings
+    if rel_path.endswith(".vue"):
+        tpl_result = extract_vue_template(source)
+        if tpl_result:
+            tpl_content, tpl_start_line = tpl_result
+            known_names = {s["name"] for s in symbols}
+            tpl_refs = scan_template_references(
+                tpl_content, tpl_start_line, known_names, rel_path,
+            )
+            all_references.extend(tpl_refs)
+
+    # Supplement: run generic extractor for inheritance refs
+    # that Tier 1 extractors may miss
+    if not isinstance(extractor, GenericExtractor) and language:
+        try:
+            generic = GenericExtractor(language=language)
+            generic_refs = generic.extract_references(tree, parsed_source, rel_path)
+            for ref in generic_refs:
+                if ref.get("kind") in ("inherits", "implements", "uses_trait"):
+                    ref["source_file"] = rel_path
+                    all_references.append(ref)
+        except Exception as e:
+            if verbose:
+                _log(f"  Warning: generic extractor failed for {rel_path}: {e}")
+
+    return result
+
+
+def _extract_file_in_worker(root: Path, rel_path: str, verbose: bool) -> tuple[dict | None, dict]:
+    """Run _extract_file and report the parse-error counts it caused.
+
+    Counters bumped inside a worker process are otherwise lost.
+    """
+    before = dict(parse_errors)
+    result = _extract_file(root, rel_path, verbose)
+    return result, {k: parse_errors[k] - before[k] for k in parse_errors}
+
+
+def _available_cpus() -> int:
+    """Return the number of CPUs this process may run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
+
+
+def _iter_extracted(root: Path, paths: list[str], workers: int | None, verbose: bool):
+    """Yield (rel_path, extracted) for each path, in input order.
+
+    Uses a process pool when there are enough files to amortise its
+    start-up; *workers* of None picks the available CPU count, 1 forces
+    serial.  If the pool cannot start or breaks part-way, the remaining
+    paths are extracted serially.
+    """
+    if workers is None:
+        workers = _available_cpus() if len(paths) >= _PARALLEL_MIN_FILES else 1
+    workers = min(workers, len(paths))
+
+    done = 0
+    if workers > 1:
+        try:
+            pool = ProcessPoolExecutor(max_workers=workers)
+        except (OSError, NotImplementedError):
+            pool = None
+        if pool is not None:
+            chunksize = max(1, min(32, len(paths) // (workers * 4)))
+            try:
+                results = pool.map(
+                    _extract_file_in_worker,
+                    [root] * len(paths), paths, [verbose] * len(paths),
+                    chunksize=chunksize,
+                )
+                for rel_path, (extracted, errors) in zip(paths, results):
+                    for key, count in errors.items():
+                        parse_errors[key] += count
+                    done += 1
+                    yield rel_path, extracted
+            except (OSError, NotImplementedError, BrokenProcessPool) as e:
+                if verbose:
+                    _log(f"  Warning: process pool failed, continuing serially: {e}")
+            finally:
+                pool.shutdown(cancel_futures=True)
+
+    for rel_path in paths[done:]:
+        yield rel_path, _extract_file(root, rel_path, verbose)
+
+
+@contextmanager
+def _gc_paused():
+    """Suspend the cyclic garbage collector for the duration of the block.
+
+    Storing a file's results allocates a row dict per symbol and keeps
+    every reference alive until resolution, so the allocation count keeps
+    triggering collector passes over a growing heap.  The records hold
+    no reference cycles, so those passes never free anything.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
 class Indexer:
     """Orchestrates the full indexing pipeline."""
 
@@ -81,12 +259,14 @@ class Indexer:
             project_root = find_project_root()
         self.root = Path(project_root).resolve()
 
-    def run(self, force: bool = False, verbose: bool = False):
+    def run(self, force: bool = False, verbose: bool = False, workers: int | None = None):
         """Run the indexing pipeline.
 
         Args:
             force: If True, re-index all files. Otherwise, only changed files.
             verbose: If True, show detailed warnings during indexing.
+            workers: Number of processes used for parsing. None picks one
+                per CPU for large batches; 1 parses in-process.
         """
         _log(f"Indexing {self.root}")
 
@@ -108,14 +288,14 @@ class Indexer:
 
         lock_path.write_text(str(os.getpid()))
         try:
-            self._do_run(force, verbose=verbose)
+            self._do_run(force, verbose=verbose, workers=workers)
         finally:
             try:
                 lock_path.unlink()
             except OSError:
                 pass
 
-    def _do_run(self, force: bool, verbose: bool = False):
+    def _do_run(self, force: bool, verbose: bool = False, workers: int | None = None):
         t0 = time.monotonic()
         # 1. Discover files
         _log("Discovering files...")
@@ -158,147 +338,84 @@ class Indexer:
             # Get extractor factory
             get_extractor = _try_import_get_extractor()
 
-            # 3-6. Parse, extract, and store for each file
+            # 3-6. Parse and extract each file (possibly in worker processes),
+            # then store the results in input order
             files_to_process = added + modified
             all_symbol_rows = {}   # symbol_id -> symbol dict
             all_references = []
             file_id_by_path = {}
 
-            for i, rel_path in enumerate(files_to_process, 1):
-                full_path = self.root / rel_path
-                language = detect_language(rel_path)
-
+            for i, (rel_path, extracted) in enumerate(
+                _iter_extracted(self.root, files_to_process, workers, verbose), 1,
+            ):
                 if (i % 100 == 0) or (i == len(files_to_process)):
                     _log(f"  Processing {i}/{len(files_to_process)} files...")
 
-                # Read source for metadata
-                try:
-                    with open(full_path, "rb") as f:
-                        source = f.read()
-                except OSError as e:
-                    if verbose:
-                        _log(f"  Warning: Could not read {rel_path}: {e}")
-                    continue
-
-                line_count = _count_lines(source)
-                complexity = _compute_complexity(source)
-                try:
-                    mtime = full_path.stat().st_mtime
-                except OSError:
-                    mtime = None
-                fhash = file_hash(full_path)
-
-                # Insert file record
-                conn.execute(
-                    "INSERT INTO files (path, language, hash, mtime, line_count) VALUES (?, ?, ?, ?, ?)",
-                    (rel_path, language, fhash, mtime, line_count),
-                )
-                row = conn.execute("SELECT last_insert_rowid()").fetchone()
-                if not row:
-                    _log(f"  Warning: Failed to insert file record for {rel_path}")
-                    continue
-                file_id = row[0]
-                file_id_by_path[rel_path] = file_id
-
-                # Store file stats (complexity)
-                conn.execute(
-                    "INSERT OR REPLACE INTO file_stats (file_id, complexity) VALUES (?, ?)",
-                    (file_id, complexity),
-                )
-
-                # Parse with tree-sitter
-                tree, parsed_source, lang = parse_file(full_path, language)
-                if tree is None:
-                    continue
-
-                # Get language extractor
-                extractor = None
-                if get_extractor is not None and lang is not None:
-                    try:
-                        extractor = get_extractor(lang)
-                    except Exception as e:
-                        if verbose:
-                            _log(f"  Warning: No extractor for {lang}: {e}")
-                        extractor = None
-
-                if extractor is None:
+                if extracted is None:
                     continue
 
-                # Extract symbols
-                symbols = extract_symbols(tree, parsed_source, rel_path, extractor)
-
-                for sym in symbols:
-                    parent_id = None
-                    if sym["parent_name"]:
-                        # Look up parent in symbols already inserted for this file
-                        parent_row = conn.execute(
-                            "SELECT id FROM symbols WHERE file_id = ? AND name = ?",
-                            (file_id, sym["parent_name"]),
-                        ).fetchone()
-                        if parent_row:
-                            parent_id = parent_row["id"]
-
+                # The collector is paused only while this file's rows are
+                # stored, not while the next file is parsed and extracted
+                with _gc_paused():
+                    # Insert file record
                     conn.execute(
-                        """INSERT INTO symbols
-                           (file_id, name, qualified_name, kind, signature,
-                            line_start, line_end, docstring, visibility,
-                            is_exported, parent_id, default_value)
-                           VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                        (
-                            file_id, sym["name"], sym["qualified_name"],
-                            sym["kind"], sym["signature"],
-                            sym["line_start"], sym["line_end"],
-                            sym["docstring"], sym["visibility"],
-                            1 if sym["is_exported"] else 0, parent_id,
-                            sym.get("default_value"),
-                        ),
+                        "INSERT INTO files (path, language, hash, mtime, line_count) VALUES (?, ?, ?, ?, ?)",
+                        (rel_path, extracted["language"], extracted["hash"],
+                         extracted["mtime"], extracted["line_count"]),
                     )
                     row = conn.execute("SELECT last_insert_rowid()").fetchone()
                     if not row:
+                        _log(f"  Warning: Failed to insert file record for {rel_path}")
                         continue
-                    sym_id = row[0]
-                    all_symbol_rows[sym_id] = {
-                        "id": sym_id,
-                        "file_id": file_id,
-                        "file_path": rel_path,
-                        "name": sym["name"],
-                        "qualified_name": sym["qualified_name"],
-                        "kind": sym["kind"],
-                        "is_exported": bool(sym.get("is_exported")),
-                        "line_start": sym["line_start"],
-                    }
+                    file_id = row[0]
+                    file_id_by_path[rel_path] = file_id
 
-                # Extract references
-                refs = extract_references(tree, parsed_source, rel_path, extractor)
-                for ref in refs:
-                    ref["source_file"] = rel_path
-                all_references.extend(refs)
-
-                # Vue template scanning: find identifiers in <template> that
-                # reference <script setup> bindings
-                if rel_path.endswith(".vue"):
-                    tpl_result = extract_vue_template(source)
-                    if tpl_result:
-                        tpl_content, tpl_start_line = tpl_result
-                        known_names = {s["name"] for s in symbols}
-                        tpl_refs = scan_template_references(
-                            tpl_content, tpl_start_line, known_names, rel_path,
-                        )
-                        all_references.extend(tpl_refs)
-
-                # Supplement: run generic extractor for inheritance refs
-                # that Tier 1 extractors may miss
-                if not isinstance(extractor, GenericExtractor) and language:
-                    try:
-                        generic = GenericExtractor(language=language)
-                        generic_refs = generic.extract_references(tree, parsed_source, rel_path)
-                        for ref in generic_refs:
-                            if ref.get("kind") in ("inherits", "implements", "uses_trait"):
-                                ref["source_file"] = rel_path
-                                all_references.append(ref)
-                    except Exception as e:
-                        if verbose:
-                            _log(f"  Warning: generic extractor failed for {rel_path}: {e}")
+                    # Store file stats (complexity)
+                    conn.execute(
+                        "INSERT OR REPLACE INTO file_stats (file_id, complexity) VALUES (?, ?)",
+                        (file_id, extracted["complexity"]),
+                    )
+
+                    # Parents are looked up among symbols already inserted
+                    # for this file; the first symbol with a name wins.
+                    sym_id_by_name = {}
+                    for sym in extracted["symbols"]:
+                        parent_id = None
+                        if sym["parent_name"]:
+                            parent_id = sym_id_by_name.get(sym["parent_name"])
+
+                        sym_id = conn.execute(
+                            """INSERT INTO symbols
+                               (file_id, name, qualified_name, kind, signature,
+                                line_start, line_end, docstring, visibility,
+                                is_exported, parent_id, default_value)
+                               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                            (
+                                file_id, sym["name"], sym["qualified_name"],
+                                sym["kind"], sym["signature"],
+                                sym["line_start"], sym["line_end"],
+                                sym["docstring"], sym["visibility"],
+                                1 if sym["is_exported"] else 0, parent_id,
+                                sym.get("default_value"),
+                            ),
+                        ).lastrowid
+                        sym_id_by_name.setdefault(sym["name"], sym_id)
+                        all_symbol_rows[sym_id] = {
+                            "id": sym_id,
+                            "file_id": file_id,
+                            "file_path": rel_path,
+                            "name": sym["name"],
+                            "qualified_name": sym["qualified_name"],
+                            "kind": sym["kind"],
+                            "is_exported": bool(sym.get("is_exported")),
+                            "line_start": sym["line_start"],
+                        }
+
+                    all_references.extend(extracted["references"])
+                    conn.execute(
+                        "INSERT INTO file_references (file_id, refs) VALUES (?, ?)",
+                        (file_id, json.dumps(extracted["references"])),
+                    )
 
             # Also load existing symbols from DB (for incremental)
             if not force:
@@ -339,7 +456,21 @@ class Indexer:
                     conn.execute("DELETE FROM edges")
                     conn.execute("DELETE FROM file_edges")
 
+                    # References stored when a file was last indexed; only
+                    # files indexed before they were stored need parsing
+                    cached_refs = {
+                        row["path"]: row["refs"] for row in conn.execute(
+                            "SELECT f.path, r.refs FROM file_references r "
+                            "JOIN files f ON f.id = r.file_id"
+                        )
+                    }
+
                     for rel_path in unchanged:
+                        refs_json = cached_refs.get(rel_path)
+                        if refs_json is not None:
+                            all_references.extend(json.loads(refs_json))
+                            continue
+                        file_refs = []
                         full_path = self.root / rel_path
                         language = detect_language(rel_path)
                         tree, parsed_source, lang = parse_file(full_path, language)
@@ -364,7 +495,7 @@ class Indexer:
                         refs = extract_references(tree, parsed_source, rel_path, extractor)
                         for ref in refs:
                             ref["source_file"] = rel_path
-                        all_references.extend(refs)
+                        file_refs.extend(refs)
                         # Vue template scanning for unchanged files
                         if rel_path.endswith(".vue"):
                             from roam.index.parser import read_source
@@ -378,7 +509,7 @@ class Indexer:
                                     tpl_refs = scan_template_references(
                                         tpl_content, tpl_start_line, known_names, rel_path,
                                     )
-                                    all_references.extend(tpl_refs)
+                                    file_refs.extend(tpl_refs)
                         # Generic supplement for unchanged files too
                         if not isinstance(extractor, GenericExtractor) and language:
                             try:
@@ -387,10 +518,17 @@ class Indexer:
                                 for ref in generic_refs:
                                     if ref.get("kind") in ("inherits", "implements", "uses_trait"):
                                         ref["source_file"] = rel_path
-                                        all_references.append(ref)
+                                        file_refs.append(ref)
                             except Exception as e:
                                 if verbose:
                                     _log(f"  Warning: generic extractor failed for {rel_path}: {e}")
+                        all_references.extend(file_refs)
+                        file_id = file_id_by_path.get(rel_path)
+                        if file_id is not None:
+                            conn.execute(
+                                "INSERT OR REPLACE INTO file_references (file_id, refs) VALUES (?, ?)",
+                                (file_id, json.dumps(file_refs)),
+                            )
 
             # 6. Resolve references into edges
             _log("Resolving references...")
@@ -3,6 +3,7 @@
 import logging
 import os
 import re
+from functools import lru_cache
 from pathlib import Path
 
 log = logging.getLogger(__name__)
@@ -137,6 +138,10 @@ def read_source(path: Path) -> bytes | None:
         return None
 
 
+# <script ...>...</script> regions of a Vue SFC
+_SCRIPT_BLOCK_RE = re.compile(r'<script(\s[^>]*)?>.*?</script>', re.DOTALL)
+
+
 def _preprocess_vue(source: bytes) -> tuple[bytes, str]:
     """Extract <script> blocks from a Vue SFC and return (processed_source, effective_language).
 
@@ -147,16 +152,10 @@ def _preprocess_vue(source: bytes) -> tuple[bytes, str]:
     lines = text.split("\n")
     effective_lang = "javascript"
 
-    # Find all <script...>...</script> regions
-    script_pattern = re.compile(
-        r'<script(\s[^>]*)?>.*?</script>',
-        re.DOTALL,
-    )
-
     # Track which lines belong to script blocks
     script_line_flags = [False] * len(lines)
 
-    for match in script_pattern.finditer(text):
+    for match in _SCRIPT_BLOCK_RE.finditer(text):
         attrs = match.group(1) or ""
         if 'lang="ts"' in attrs or "lang='ts'" in attrs or 'lang="tsx"' in attrs:
             effective_lang = "typescript"
@@ -191,6 +190,18 @@ def _preprocess_vue(source: bytes) -> tuple[bytes, str]:
     return processed.encode("utf-8"), effective_lang
 
 
+@lru_cache(maxsize=None)
+def _get_parser(grammar_language: str):
+    """Return this process's Parser for *grammar_language*, creating it once.
+
+    Index workers parse many files each; they reuse one Parser per grammar
+    instead of loading the Language and building a Parser for every file.
+    A failed lookup raises and is therefore not cached.  A Parser is not
+    safe to use from two threads at once; workers are separate processes.
+    """
+    return get_parser(grammar_language)
+
+
 def parse_file(path: Path, language: str | None = None):
     """Parse a file with tree-sitter and return (tree, source_bytes, language).
 
@@ -221,7 +232,7 @@ def parse_file(path: Path, language: str | None = None):
         grammar_language = "xml"
 
     try:
-        parser = get_parser(grammar_language)
+        parser = _get_parser(grammar_language)
     except Exception:
         parse_errors["no_grammar"] += 1
         return None, None, None  # Grammar not available, expected skip
@@ -236,6 +247,29 @@ def parse_file(path: Path, language: str | None = None):
     return tree, source, language
 
 
+# The outer <template...> open tag (the SFC root template)
+_TEMPLATE_OPEN_RE = re.compile(r'<template(\s[^>]*)?>')
+# Any <template...>, </template> or <template .../> tag.
+# Non-greedy [^>]*? so that self-closing / isn't consumed by attributes
+_TEMPLATE_TAG_RE = re.compile(r'<(/?)template\b([^>]*?)(/?)>')
+
+# Patterns to extract expression strings from template
+# Mustache interpolations: {{ expression }}
+# Attribute bindings: :attr="expression" or v-bind:attr="expression"
+# Directives: v-if="expression", v-for="expr", v-show="expr", etc.
+# Event handlers: @event="handler" or v-on:event="handler"
+_TEMPLATE_EXPR_PATTERNS = (
+    re.compile(r'\{\{(.*?)\}\}', re.DOTALL),           # {{ expr }}
+    re.compile(r'(?::|v-bind:)[\w.-]+="([^"]*)"'),     # :attr="expr"
+    re.compile(r'v-[\w-]+="([^"]*)"'),                  # v-directive="expr"
+    re.compile(r'(?:@|v-on:)[\w.-]+="([^"]*)"'),       # @event="handler"
+)
+# Identifier pattern
+_TEMPLATE_IDENT_RE = re.compile(r'\b([a-zA-Z_$][a-zA-Z0-9_$]*)\b')
+# PascalCase component names: <MyComponent> → MyComponent
+_TEMPLATE_COMPONENT_RE = re.compile(r'<([A-Z][a-zA-Z0-9]+)')
+
+
 def extract_vue_template(source: bytes) -> tuple[str, int] | None:
     """Extract the <template> block content from a Vue SFC.
 
@@ -247,7 +281,7 @@ def extract_vue_template(source: bytes) -> tuple[str, int] | None:
     text = source.decode("utf-8", errors="replace")
 
     # Find the outer <template...> open tag (the SFC root template)
-    outer_open = re.search(r'<template(\s[^>]*)?>',  text)
+    outer_open = _TEMPLATE_OPEN_RE.search(text)
     if not outer_open:
         return None
 
@@ -255,9 +289,7 @@ def extract_vue_template(source: bytes) -> tuple[str, int] | None:
     depth = 1
 
     # Scan for all <template...> and </template> tags after the outer open
-    # Use non-greedy [^>]*? so that self-closing / isn't consumed by attributes
-    tag_re = re.compile(r'<(/?)template\b([^>]*?)(/?)>')
-    for m in tag_re.finditer(text, pos=content_start):
+    for m in _TEMPLATE_TAG_RE.finditer(text, pos=content_start):
         is_closing = m.group(1) == '/'
         is_self_closing = m.group(3) == '/'
 
@@ -290,35 +322,22 @@ def scan_template_references(
     if not template_content or not known_symbols:
         return []
 
-    # Patterns to extract expression strings from template
-    # Mustache interpolations: {{ expression }}
-    # Attribute bindings: :attr="expression" or v-bind:attr="expression"
-    # Directives: v-if="expression", v-for="expr", v-show="expr", etc.
-    # Event handlers: @event="handler" or v-on:event="handler"
-    expr_patterns = [
-        re.compile(r'\{\{(.*?)\}\}', re.DOTALL),           # {{ expr }}
-        re.compile(r'(?::|v-bind:)[\w.-]+="([^"]*)"'),     # :attr="expr"
-        re.compile(r'v-[\w-]+="([^"]*)"'),                  # v-directive="expr"
-        re.compile(r'(?:@|v-on:)[\w.-]+="([^"]*)"'),       # @event="handler"
-    ]
-    # Identifier pattern
-    ident_re = re.compile(r'\b([a-zA-Z_$][a-zA-Z0-9_$]*)\b')
-
-    # Also detect PascalCase component names: <MyComponent> → MyComponent
-    component_re = re.compile(r'<([A-Z][a-zA-Z0-9]+)')
-
     refs = []
     seen = set()
 
     # Pass 1: Extract identifiers from template expressions on FULL content.
     # This handles multi-line attribute values like :class="cn(\n  isRowFocused(row)\n)"
     # where the opening " and closing " are on different lines.
-    for pattern in expr_patterns:
+    for pattern in _TEMPLATE_EXPR_PATTERNS:
+        # Matches come in order, so count newlines since the previous one
+        # rather than from the start of the template each time
+        line_num = start_line
+        pos = 0
         for match in pattern.finditer(template_content):
             expr = match.group(1)
-            # Compute line number from match position
-            line_num = start_line + template_content[:match.start()].count("\n")
-            for ident_match in ident_re.finditer(expr):
+            line_num += template_content.count("\n", pos, match.start())
+            pos = match.start()
+            for ident_match in _TEMPLATE_IDENT_RE.finditer(expr):
                 name = ident_match.group(1)
                 if name in known_symbols and name not in seen:
                     seen.add(name)
@@ -334,7 +353,7 @@ def scan_template_references(
     lines = template_content.split("\n")
     for line_offset, line in enumerate(lines):
         line_num = start_line + line_offset
-        for match in component_re.finditer(line):
+        for match in _TEMPLATE_COMPONENT_RE.finditer(line):
             name = match.group(1)
             if name in known_symbols and name not in seen:
                 seen.add(name)
@@ -1,6 +1,7 @@
 """Import and call resolution into graph edges."""
 
 import os
+from bisect import bisect_right
 
 
 def resolve_references(
@@ -35,17 +36,9 @@ def resolve_references(
             if key[0] and key[1]:
                 import_map[key] = ref["import_path"]
 
-    # Build fallback map: file_path -> sorted list of symbols for line-based lookup
-    # Used when source_name is None/empty (top-level code, e.g. Vue <script setup>)
-    _file_symbols: dict[str, list[dict]] = {}
-    for sym_list in symbols_by_name.values():
-        for sym in sym_list:
-            fp = sym.get("file_path", "")
-            if fp:
-                _file_symbols.setdefault(fp, []).append(sym)
-    # Sort each file's symbols by line_start for binary-search-style lookup
-    for fp in _file_symbols:
-        _file_symbols[fp].sort(key=lambda s: s.get("line_start") or 0)
+    # Fallback map used when source_name is None/empty (top-level code,
+    # e.g. Vue <script setup>)
+    _file_symbols = _build_file_symbols(symbols_by_name)
 
     # Also index source symbols by name for finding the caller
     edges = []
@@ -379,33 +372,63 @@ def _canonical_sf_match(name: str, candidates: list[dict]) -> dict | None:
     return None
 
 
+def _build_file_symbols(
+    symbols_by_name: dict[str, list[dict]],
+) -> dict[str, tuple[list[int], list[dict]]]:
+    """Map each file path to its symbols sorted by line_start, for _closest_symbol.
+
+    Each file's symbols are paired with their line_start values.  When
+    none of a file's symbols has a line_end (the indexer's rows carry
+    only line_start), none can contain a reference, so the line_start
+    list is left empty and every lookup goes straight to the file-level
+    fallback instead of scanning back over all earlier symbols.
+    """
+    syms_by_file: dict[str, list[dict]] = {}
+    for sym_list in symbols_by_name.values():
+        for sym in sym_list:
+            fp = sym.get("file_path", "")
+            if fp:
+                syms_by_file.setdefault(fp, []).append(sym)
+    file_symbols: dict[str, tuple[list[int], list[dict]]] = {}
+    for fp, syms in syms_by_file.items():
+        syms.sort(key=lambda s: s.get("line_start") or 0)
+        if any(s.get("line_end") for s in syms):
+            line_starts = [s.get("line_start") or 0 for s in syms]
+        else:
+            line_starts = []
+        file_symbols[fp] = (line_starts, syms)
+    return file_symbols
+
+
 def _closest_symbol(
     source_file: str,
     ref_line: int | None,
-    file_symbols: dict[str, list[dict]],
+    file_symbols: dict[str, tuple[list[int], list[dict]]],
 ) -> dict | None:
     """Find the symbol that contains ref_line, or fall back to file-level source.
 
+    *file_symbols* maps each file to its symbols sorted by line_start,
+    paired with the list of those line_start values (see
+    _build_file_symbols; the list is empty when no symbol has a line_end).
+
     Prefers the most-nested symbol whose line_start <= ref_line <= line_end.
     When no symbol contains the reference (module-scope code like watch callbacks),
     returns the first symbol in the file as a file-level source to avoid
     self-references from "closest before" matching a completed function.
     """
-    syms = file_symbols.get(source_file)
+    line_starts, syms = file_symbols.get(source_file, ((), ()))
     if not syms:
         return None
     if ref_line is None:
         return syms[0]
 
-    # Prefer symbol that CONTAINS the reference line (most nested wins)
-    containing = None
-    for sym in syms:
-        ls = sym.get("line_start") or 0
-        le = sym.get("line_end") or 0
-        if ls <= ref_line and le >= ref_line and le > 0:
-            containing = sym  # last containing wins (most nested)
-    if containing:
-        return containing
+    # Prefer symbol that CONTAINS the reference line.  Only symbols starting
+    # at or before it can; of those, the last containing one is the most
+    # nested, so scan back from the bisection point.
+    for i in range(bisect_right(line_starts, ref_line) - 1, -1, -1):
+        le = syms[i].get("line_end") or 0
+        if le >= ref_line and le > 0:
+            return syms[i]
 
     # No containing symbol — reference is at module scope.
     # Return first symbol in file as a "file-level" source.
@@ -1,11 +1,21 @@
 """Symbol and reference extraction from tree-sitter ASTs."""
 
+# Key sets produced by LanguageExtractor._make_symbol / _make_reference.
+# Records with exactly these keys are already normalised and pass through
+# without being copied.
+_SYMBOL_KEYS = frozenset((
+    "name", "qualified_name", "kind", "signature", "line_start", "line_end",
+    "docstring", "visibility", "is_exported", "parent_name", "default_value",
+))
+_REFERENCE_KEYS = frozenset(("source_name", "target_name", "kind", "line", "import_path"))
+
 
 def extract_symbols(tree, source: bytes, file_path: str, extractor) -> list[dict]:
     """Extract symbol definitions from a parsed AST.
 
     Uses a language-specific extractor that implements:
         extractor.extract_symbols(tree, source, file_path) -> list[dict]
+    (or any iterable of dicts, e.g. a generator)
 
     Each returned dict has:
         name, qualified_name, kind, signature, line_start, line_end,
@@ -15,13 +25,18 @@ def extract_symbols(tree, source: bytes, file_path: str, extractor) -> list[dict
         return []
     try:
         symbols = extractor.extract_symbols(tree, source, file_path)
+        if not isinstance(symbols, list):
+            # Extractors may also yield their symbols
+            symbols = list(symbols)
     except Exception:
         return []
 
-    # Ensure every symbol dict has all required keys with defaults
-    normalised = []
-    for sym in symbols:
-        normalised.append({
+    # Ensure every symbol dict has all required keys with defaults,
+    # replacing records in place instead of copying the whole list
+    for i, sym in enumerate(symbols):
+        if sym.keys() == _SYMBOL_KEYS:
+            continue
+        symbols[i] = {
             "name": sym.get("name", ""),
             "qualified_name": sym.get("qualified_name", sym.get("name", "")),
             "kind": sym.get("kind", "unknown"),
@@ -33,8 +48,8 @@ def extract_symbols(tree, source: bytes, file_path: str, extractor) -> list[dict
             "is_exported": sym.get("is_exported", True),
             "parent_name": sym.get("parent_name"),
             "default_value": sym.get("default_value"),
-        })
-    return normalised
+        }
+    return symbols
 
 
 def extract_references(tree, source: bytes, file_path: str, extractor) -> list[dict]:
@@ -42,6 +57,7 @@ def extract_references(tree, source: bytes, file_path: str, extractor) -> list[d
 
     Uses a language-specific extractor that implements:
         extractor.extract_references(tree, source, file_path) -> list[dict]
+    (or any iterable of dicts, e.g. a generator)
 
     Each returned dict has:
         source_name, target_name, kind, line, import_path
@@ -50,16 +66,19 @@ def extract_references(tree, source: bytes, file_path: str, extractor) -> list[d
         return []
     try:
         refs = extractor.extract_references(tree, source, file_path)
+        if not isinstance(refs, list):
+            refs = list(refs)
     except Exception:
         return []
 
-    normalised = []
-    for ref in refs:
-        normalised.append({
+    for i, ref in enumerate(refs):
+        if ref.keys() == _REFERENCE_KEYS:
+            continue
+        refs[i] = {
             "source_name": ref.get("source_name", ""),
             "target_name": ref.get("target_name", ""),
             "kind": ref.get("kind", "call"),
             "line": ref.get("line"),
             "import_path": ref.get("import_path"),
-        })
-    return normalised
+        }
+    return refs
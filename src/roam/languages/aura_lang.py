@@ -32,6 +32,16 @@ from .base import LanguageExtractor
 _COMPONENT_TAG_RE = re.compile(r'<([a-zA-Z]+):([A-Z]\w+)')
 # Regex to find aura attribute values
 _ATTR_RE = re.compile(r'(\w+)\s*=\s*"([^"]*)"')
+# Regex to find $Label.c.LabelName references in attribute values
+_LABEL_REF_RE = re.compile(r'\$Label\.c\.(\w+)')
+
+# Root tag -> symbol kind for the component/app/event/interface itself
+_ROOT_KINDS = {
+    "aura:component": "class",
+    "aura:application": "class",
+    "aura:event": "class",
+    "aura:interface": "interface",
+}
 
 
 class AuraExtractor(LanguageExtractor):
@@ -52,7 +62,9 @@ class AuraExtractor(LanguageExtractor):
 
     def extract_references(self, tree, source: bytes, file_path: str) -> list[dict]:
         refs: list[dict] = []
-        self._walk_refs(tree.root_node, source, refs, file_path)
+        # Bound once per file and passed down the walk, not per element
+        self._walk_refs(tree.root_node, source, refs, file_path,
+                        self._make_reference, refs.append)
         return refs
 
     # ------------------------------------------------------------------ #
@@ -62,14 +74,8 @@ class AuraExtractor(LanguageExtractor):
     def _walk_symbols(self, node, source, symbols, file_path):
         if node.type == "element":
             tag = self._get_tag(node, source)
-            if tag in ("aura:component", "aura:application", "aura:event", "aura:interface"):
-                kind_map = {
-                    "aura:component": "class",
-                    "aura:application": "class",
-                    "aura:event": "class",
-                    "aura:interface": "interface",
-                }
-                kind = kind_map[tag]
+            kind = _ROOT_KINDS.get(tag)
+            if kind is not None:
                 comp_name = self._derive_name(file_path)
                 sig = f"{tag.split(':')[1]} {comp_name}"
 
@@ -92,16 +98,26 @@ class AuraExtractor(LanguageExtractor):
                 ))
 
                 # Walk children for attributes/methods/handlers
-                self._walk_aura_members(node, source, symbols, comp_name)
+                symbols.extend(self._iter_aura_members(node, comp_name, source))
                 return
 
         for child in node.children:
             self._walk_symbols(child, source, symbols, file_path)
 
-    def _walk_aura_members(self, node, source, symbols, parent_name):
-        """Walk an Aura component body for attribute/method/handler declarations."""
-        for child in node.children:
-            if child.type == "element":
+    def _iter_aura_members(self, node, parent_name, source):
+        """Yield symbols for an Aura component's attribute/method/handler declarations.
+
+        Member tags are only valid as direct children of the root element,
+        so only the root's ``content`` is scanned; the markup body below it
+        is never descended into.
+        """
+        make_symbol = self._make_symbol
+        for content in node.children:
+            if content.type != "content":
+                continue
+            for child in content.children:
+                if child.type != "element":
+                    continue
                 tag = self._get_tag(child, source)
                 attrs = self._get_attrs(child, source)
 
@@ -115,7 +131,7 @@ class AuraExtractor(LanguageExtractor):
                         default = attrs.get("default")
                         if default:
                             sig += f" = {default}"
-                        symbols.append(self._make_symbol(
+                        yield make_symbol(
                             name=name,
                             kind="field",
                             line_start=child.start_point[0] + 1,
@@ -126,13 +142,13 @@ class AuraExtractor(LanguageExtractor):
                             visibility="public",
                             is_exported=True,
                             parent_name=parent_name,
-                        ))
+                        )
 
                 elif tag == "aura:method":
                     name = attrs.get("name", "")
                     if name:
                         sig = f"method {name}"
-                        symbols.append(self._make_symbol(
+                        yield make_symbol(
                             name=name,
                             kind="method",
                             line_start=child.start_point[0] + 1,
@@ -143,7 +159,7 @@ class AuraExtractor(LanguageExtractor):
                             visibility="public",
                             is_exported=True,
                             parent_name=parent_name,
-                        ))
+                        )
 
                 elif tag == "aura:handler":
                     name = attrs.get("name", "")
@@ -152,7 +168,7 @@ class AuraExtractor(LanguageExtractor):
                         action = attrs.get("action")
                         if action:
                             sig += f" -> {action}"
-                        symbols.append(self._make_symbol(
+                        yield make_symbol(
                             name=name,
                             kind="method",
                             line_start=child.start_point[0] + 1,
@@ -162,7 +178,7 @@ class AuraExtractor(LanguageExtractor):
                             visibility="public",
                             is_exported=True,
                             parent_name=parent_name,
-                        ))
+                        )
 
                 elif tag == "aura:registerEvent":
                     name = attrs.get("name", "")
@@ -171,7 +187,7 @@ class AuraExtractor(LanguageExtractor):
                         sig = f"registerEvent {name}"
                         if etype:
                             sig += f" : {etype}"
-                        symbols.append(self._make_symbol(
+                        yield make_symbol(
                             name=name,
                             kind="field",
                             line_start=child.start_point[0] + 1,
@@ -181,16 +197,13 @@ class AuraExtractor(LanguageExtractor):
                             visibility="public",
                             is_exported=True,
                             parent_name=parent_name,
-                        ))
-
-            # Recurse into child elements
-            self._walk_aura_members(child, source, symbols, parent_name)
+                        )
 
     # ------------------------------------------------------------------ #
     #  Reference extraction                                               #
     # ------------------------------------------------------------------ #
 
-    def _walk_refs(self, node, source, refs, file_path):
+    def _walk_refs(self, node, source, refs, file_path, make_reference, append):
         if node.type == "element":
             tag = self._get_tag(node, source)
             attrs = self._get_attrs(node, source)
@@ -200,7 +213,7 @@ class AuraExtractor(LanguageExtractor):
                 # controller="MyApexController" -> reference
                 controller = attrs.get("controller")
                 if controller:
-                    refs.append(self._make_reference(
+                    append(make_reference(
                         target_name=controller,
                         kind="reference",
                         line=node.start_point[0] + 1,
@@ -209,7 +222,7 @@ class AuraExtractor(LanguageExtractor):
                 extends = attrs.get("extends")
                 if extends:
                     name = extends.split(":")[-1] if ":" in extends else extends
-                    refs.append(self._make_reference(
+                    append(make_reference(
                         target_name=name,
                         kind="inherits",
                         line=node.start_point[0] + 1,
@@ -220,7 +233,7 @@ class AuraExtractor(LanguageExtractor):
                     for iface in implements.split(","):
                         iface = iface.strip()
                         if iface:
-                            refs.append(self._make_reference(
+                            append(make_reference(
                                 target_name=iface,
                                 kind="implements",
                                 line=node.start_point[0] + 1,
@@ -231,7 +244,7 @@ class AuraExtractor(LanguageExtractor):
                 event = attrs.get("event")
                 if event:
                     name = event.split(":")[-1] if ":" in event else event
-                    refs.append(self._make_reference(
+                    append(make_reference(
                         target_name=name,
                         kind="reference",
                         line=node.start_point[0] + 1,
@@ -242,7 +255,7 @@ class AuraExtractor(LanguageExtractor):
                 etype = attrs.get("type")
                 if etype:
                     name = etype.split(":")[-1] if ":" in etype else etype
-                    refs.append(self._make_reference(
+                    append(make_reference(
                         target_name=name,
                         kind="reference",
                         line=node.start_point[0] + 1,
@@ -252,7 +265,7 @@ class AuraExtractor(LanguageExtractor):
             elif tag == "force:recordData":
                 sobject = attrs.get("sobjecttype") or attrs.get("objectapiname")
                 if sobject:
-                    refs.append(self._make_reference(
+                    append(make_reference(
                         target_name=sobject,
                         kind="reference",
                         line=node.start_point[0] + 1,
@@ -263,7 +276,7 @@ class AuraExtractor(LanguageExtractor):
                 ns, comp = tag.split(":", 1)
                 # Skip aura: namespace (already handled above)
                 if ns != "aura" and comp[0:1].isupper():
-                    refs.append(self._make_reference(
+                    append(make_reference(
                         target_name=comp,
                         kind="reference",
                         line=node.start_point[0] + 1,
@@ -274,18 +287,17 @@ class AuraExtractor(LanguageExtractor):
                 self._extract_label_refs(attrs, node.start_point[0] + 1, refs)
 
         for child in node.children:
-            self._walk_refs(child, source, refs, file_path)
+            self._walk_refs(child, source, refs, file_path, make_reference, append)
 
     @staticmethod
     def _extract_label_refs(attrs, line, refs):
         """Extract $Label.c.LabelName references from Aura attribute values."""
-        import re
-        pattern = re.compile(r'\$Label\.c\.(\w+)')
+        append = refs.append
         for val in attrs.values():
             if "$Label" not in val:
                 continue
-            for m in pattern.finditer(val):
-                refs.append({
+            for m in _LABEL_REF_RE.finditer(val):
+                append({
                     "source_name": None,
                     "target_name": m.group(1),
                     "kind": "reference",
@@ -303,7 +315,7 @@ class AuraExtractor(LanguageExtractor):
             if child.type in ("STag", "EmptyElemTag"):
                 for sub in child.children:
                     if sub.type == "Name":
-                        return self.node_text(sub, source)
+                        return self._name_text(sub, source)
         return None
 
     def _get_attrs(self, element_node, source: bytes) -> dict[str, str]:
@@ -321,8 +333,12 @@ class AuraExtractor(LanguageExtractor):
                             elif attr_child.type == "AttValue":
                                 value_node = attr_child
                         if name_node and value_node:
-                            k = self.node_text(name_node, source).lower()
-                            v = self.node_text(value_node, source).strip('"\'')
+                            k = self._name_text(name_node, source).lower()
+                            # AttValue spans include their quote pair; slice
+                            # it off instead of strip(), so quotes inside the
+                            # value (default="'x'") are kept
+                            v = source[value_node.start_byte + 1:value_node.end_byte - 1].decode(
+                                "utf-8", errors="replace")
                             attrs[k] = v
         return attrs
 
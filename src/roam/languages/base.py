@@ -51,6 +51,32 @@ class LanguageExtractor(ABC):
             return ""
         return source[node.start_byte:node.end_byte].decode("utf-8", errors="replace")
 
+    def _name_text(self, node, source: bytes) -> str:
+        """Decode an identifier-like node (tag or attribute name).
+
+        A strict decode avoids passing ``errors=``, which costs more than
+        the decode itself for the many short names in markup.  Only bytes
+        that are not valid UTF-8 take the replacing decode node_text uses.
+        """
+        raw = source[node.start_byte:node.end_byte]
+        try:
+            return raw.decode()
+        except UnicodeDecodeError:
+            return raw.decode("utf-8", errors="replace")
+
+    def _text_prefix(self, node, source: bytes, limit: int) -> str:
+        """Return node_text(node, source)[:limit] without decoding the rest.
+
+        A UTF-8 character is at most four bytes, so the first ``4 * limit``
+        bytes always hold the first *limit* characters; long values such
+        as object literals are not decoded in full just to be truncated.
+        """
+        if node is None:
+            return ""
+        start = node.start_byte
+        end = min(node.end_byte, start + 4 * limit)
+        return source[start:end].decode("utf-8", errors="replace")[:limit]
+
     def _params_text(self, node, source: bytes) -> str:
         """Get parameter list text, stripping outer parens if present."""
         if node is None:
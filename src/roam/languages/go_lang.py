@@ -162,7 +162,7 @@ class GoExtractor(LanguageExtractor):
             sig = f"type {name} interface"
             self._extract_interface_methods(type_node, source, symbols, name)
         else:
-            sig += f" {self.node_text(type_node, source)[:60]}"
+            sig += f" {self._text_prefix(type_node, source, 60)}"
 
         symbols.append(self._make_symbol(
             name=name,
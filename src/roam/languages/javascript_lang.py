@@ -1,9 +1,139 @@
+import threading
+from functools import lru_cache
+
 from .base import LanguageExtractor
+from .registry import get_ts_language
+
+
+_DECL_KEYWORDS = ("const", "let", "var")
+# Spans compared as raw bytes, so they need not be decoded first
+_EXPORT_TARGETS = (b"module.exports", b"exports")
+_METHOD_MODIFIERS = frozenset((b"static", b"async", b"get", b"set"))
+# Longer spans (e.g. a method body) are never sliced to test for a modifier
+_METHOD_MODIFIER_MAX_LEN = max(map(len, _METHOD_MODIFIERS))
+# JS keywords to skip when extracting identifier references from arguments
+_JS_KEYWORDS = frozenset((
+    b"true", b"false", b"null", b"undefined", b"this", b"super", b"arguments",
+    b"new", b"void", b"typeof", b"instanceof", b"in", b"of", b"async", b"await",
+    b"yield", b"return", b"throw", b"delete", b"NaN", b"Infinity",
+))
+
+# Destructuring pattern children that bind a name directly
+_IDENTIFIER_PATTERNS = frozenset((
+    "shorthand_property_identifier_pattern", "shorthand_property_identifier", "identifier",
+))
+
+# Grammars whose trees the JS/TS extractors are handed
+_GRAMMARS = ("javascript", "typescript", "tsx")
+
+
+@lru_cache(maxsize=None)
+def _languages_by_root_kind() -> dict:
+    """Map each grammar's ``program`` kind id to its Language.
+
+    ``Tree.language`` is unsafe once the parser that built the tree has
+    been garbage-collected, so the grammar is recognised from the root
+    node's kind id instead; it differs between the three grammars.
+    """
+    languages = [get_ts_language(name) for name in _GRAMMARS]
+    return {lang.id_for_node_kind("program", True): lang for lang in languages}
+
+
+@lru_cache(maxsize=None)
+def _kind_ids(language, kinds: tuple[str, ...]) -> dict[int, str]:
+    kind_ids = {}
+    for kind in kinds:
+        # An anonymous token with the same name (e.g. the ``class``
+        # keyword) maps to the kind too, as a node.type comparison would
+        for named in (True, False):
+            kind_id = language.id_for_node_kind(kind, named)
+            if kind_id:
+                kind_ids[kind_id] = kind
+    return kind_ids
+
+
+@lru_cache(maxsize=None)
+def _field_ids(language, fields: tuple[str, ...]) -> dict[str, int]:
+    return {field: language.field_id_for_name(field) for field in fields}
+
+
+def _root_language(root, grammar: str):
+    """Return the Language *root* was parsed with.
+
+    A tree whose root is not a ``program`` node (an ``ERROR`` root,
+    which real files can produce) carries no grammar-specific kind id,
+    so *grammar*, the extractor's guess from the file name, is used.
+    """
+    language = _languages_by_root_kind().get(root.kind_id)
+    if language is None:
+        language = get_ts_language(grammar)
+    return language
+
+
+def _node_kinds(root, grammar: str, kinds: tuple[str, ...]) -> dict[int, str]:
+    """Map the kind ids of *kinds* in *root*'s grammar back to their names.
+
+    Walkers look nodes up by ``node.kind_id`` (a plain int) instead of
+    building a ``node.type`` string for every node.  Ids differ between
+    the JS, TS and TSX grammars, so maps are built per grammar.
+    """
+    return _kind_ids(_root_language(root, grammar), kinds)
+
+
+def _node_fields(root, grammar: str, fields: tuple[str, ...]) -> dict[str, int]:
+    """Map *fields* to their field ids in *root*'s grammar.
+
+    ``child_by_field_id`` skips the name lookup ``child_by_field_name``
+    repeats on every call; like kind ids, field ids differ per grammar.
+    """
+    return _field_ids(_root_language(root, grammar), fields)
+
+
+@lru_cache(maxsize=4096)
+def _require_target(path: str) -> str:
+    """Target name for ``require(path)``; cached, as modules are required from many files."""
+    # Use last path segment as target name
+    target = path.rsplit("/", 1)[-1] if "/" in path else path
+    # Strip .js/.json extension
+    for ext in (".js", ".json", ".mjs", ".cjs"):
+        if target.endswith(ext):
+            return target[:-len(ext)]
+    return target
+
+
+def _parse_jsdoc(source: bytes, start: int, end: int) -> str:
+    """Return the body of the ``/** ... */`` comment at source[start:end]."""
+    text = source[start:end].decode("utf-8", errors="replace").rstrip()
+    # Strip /** and */
+    text = text[3:]
+    if text.endswith("*/"):
+        text = text[:-2]
+    return text.strip()
+
+
+class _ExtractionState(threading.local):
+    """Per-thread state carried from extract_symbols to extract_references.
+
+    Extractors are shared (the registry caches one per language), so
+    this state is kept per thread to let threads extract concurrently.
+    """
+
+    def __init__(self):
+        # Inheritance refs found by extract_symbols, handed out by the
+        # next extract_references call
+        self.pending_inherits = []
+        # Name -> symbols index over symbols[:symbols_indexed], for
+        # marking symbols exported by module.exports/exports assignments
+        self.symbols_by_name = {}
+        self.symbols_indexed = 0
 
 
 class JavaScriptExtractor(LanguageExtractor):
     """Full JavaScript symbol and reference extractor."""
 
+    def __init__(self):
+        self._state = _ExtractionState()
+
     @property
     def language_name(self) -> str:
         return "javascript"
@@ -12,58 +142,120 @@ class JavaScriptExtractor(LanguageExtractor):
     def file_extensions(self) -> list[str]:
         return [".js", ".jsx", ".mjs", ".cjs"]
 
+    # Node kinds _extract_symbol_node handles; everything else is descended into
+    _SYMBOL_NODE_KINDS = (
+        "function_declaration", "generator_function_declaration",
+        "class_declaration", "class", "lexical_declaration",
+        "variable_declaration", "expression_statement", "export_statement",
+    )
+    # Node kinds whose subtrees can never declare a symbol; _walk_symbols
+    # skips them instead of visiting every fragment inside
+    _SYMBOL_PRUNE_KINDS = ("string", "regex", "import_statement")
+    # Node kinds _walk_refs dispatches on
+    _REF_NODE_KINDS = (
+        "import_statement", "export_statement", "call_expression",
+        "new_expression", "identifier", "shorthand_property_identifier",
+        "function_declaration", "class_declaration",
+        "generator_function_declaration", "lexical_declaration",
+        "variable_declaration", "arguments",
+    )
+    # Literal kinds whose subtrees can never hold a call or a reference
+    _REF_PRUNE_KINDS = ("string", "regex")
+    # Fields _extract_call and _extract_new read on every call site
+    _REF_FIELDS = ("function", "property", "arguments", "constructor")
+
     def extract_symbols(self, tree, source: bytes, file_path: str) -> list[dict]:
         symbols = []
-        if not hasattr(self, '_pending_inherits'):
-            self._pending_inherits = []
-        self._walk_symbols(tree.root_node, source, file_path, symbols, parent_name=None, is_exported=False)
+        state = self._state
+        state.pending_inherits = []
+        state.symbols_by_name = {}
+        state.symbols_indexed = 0
+        grammar = self._grammar_for(file_path)
+        kinds = _node_kinds(tree.root_node, grammar, self._SYMBOL_NODE_KINDS + self._SYMBOL_PRUNE_KINDS)
+        self._walk_symbols(tree.root_node, source, file_path, symbols,
+                           parent_name=None, is_exported=False, kinds=kinds)
         return symbols
 
     def extract_references(self, tree, source: bytes, file_path: str) -> list[dict]:
         refs = []
-        self._walk_refs(tree.root_node, source, refs, scope_name=None)
-        # Collect inheritance refs accumulated during extract_symbols
-        refs.extend(getattr(self, '_pending_inherits', []))
-        self._pending_inherits = []
+        state = self._state
+        try:
+            grammar = self._grammar_for(file_path)
+            kinds = _node_kinds(tree.root_node, grammar, self._REF_NODE_KINDS + self._REF_PRUNE_KINDS)
+            fields = _node_fields(tree.root_node, grammar, self._REF_FIELDS)
+            self._walk_refs(tree.root_node, source, refs, scope_name=None, kinds=kinds, fields=fields)
+            # Collect inheritance refs accumulated during extract_symbols
+            refs.extend(state.pending_inherits)
+        finally:
+            # Drop this file's state so the thread does not keep its
+            # symbols alive until the next JS/TS file
+            state.pending_inherits = []
+            state.symbols_by_name = {}
+            state.symbols_indexed = 0
         return refs
 
+    def _grammar_for(self, file_path: str) -> str:
+        """Grammar assumed for *file_path* when its tree's root does not say."""
+        return "javascript"
+
     def get_docstring(self, node, source: bytes) -> str | None:
         """JSDoc: look for comment node immediately before this node."""
         prev = node.prev_sibling
-        if prev and prev.type == "comment":
-            text = self.node_text(prev, source).strip()
-            if text.startswith("/**"):
-                # Strip /** and */
-                text = text[3:]
-                if text.endswith("*/"):
-                    text = text[:-2]
-                return text.strip()
+        # Check for the /** opener on the raw bytes so line and block
+        # comments that are not JSDoc are never decoded
+        if prev and prev.type == "comment" and source.startswith(b"/**", prev.start_byte):
+            return _parse_jsdoc(source, prev.start_byte, prev.end_byte)
         return None
 
     # ---- Symbol extraction ----
 
-    def _walk_symbols(self, node, source, file_path, symbols, parent_name, is_exported):
-        for child in node.children:
-            exported = is_exported or self._is_export_node(child)
-
-            if child.type == "function_declaration":
-                self._extract_function(child, source, symbols, parent_name, exported)
-            elif child.type == "generator_function_declaration":
-                self._extract_function(child, source, symbols, parent_name, exported, generator=True)
-            elif child.type in ("class_declaration", "class"):
-                self._extract_class(child, source, file_path, symbols, parent_name, exported)
-            elif child.type in ("lexical_declaration", "variable_declaration"):
-                self._extract_variable_decl(child, source, file_path, symbols, parent_name, exported)
-            elif child.type == "export_statement":
-                # Walk the export's children with exported=True
-                self._walk_symbols(child, source, file_path, symbols, parent_name, is_exported=True)
-            elif child.type == "expression_statement":
-                self._extract_module_exports(child, source, symbols, parent_name)
-            else:
-                self._walk_symbols(child, source, file_path, symbols, parent_name, is_exported)
-
-    def _is_export_node(self, node) -> bool:
-        return node.type == "export_statement"
+    def _walk_symbols(self, node, source, file_path, symbols, parent_name, is_exported, kinds):
+        # Iterative pre-order walk with a TreeCursor: avoids building a
+        # children list and a Python frame for every node.  ``exported``
+        # holds the export flag for each depth below ``node``.
+        cursor = node.walk()
+        extract_symbol_node = self._extract_symbol_node
+        prune_kinds = self._SYMBOL_PRUNE_KINDS
+        if not cursor.goto_first_child():
+            return
+        exported = [is_exported]
+        while True:
+            child = cursor.node
+            node_type = kinds.get(child.kind_id)
+            child_exported = exported[-1] or node_type == "export_statement"
+            if node_type is None or (node_type not in prune_kinds and not extract_symbol_node(
+                child, node_type, source, file_path, symbols, parent_name, child_exported,
+            )):
+                if cursor.goto_first_child():
+                    exported.append(child_exported)
+                    continue
+            while not cursor.goto_next_sibling():
+                if len(exported) == 1:
+                    return
+                cursor.goto_parent()
+                exported.pop()
+
+    def _extract_symbol_node(self, node, node_type, source, file_path, symbols, parent_name, is_exported) -> bool:
+        """Extract symbols declared by *node*, whose kind is *node_type*.
+
+        Only called for kinds listed in _SYMBOL_NODE_KINDS.  Returns True
+        if the node was handled, False if the walker should descend into
+        its children (export statements).
+        """
+        if node_type == "function_declaration":
+            self._extract_function(node, source, symbols, parent_name, is_exported)
+        elif node_type == "generator_function_declaration":
+            self._extract_function(node, source, symbols, parent_name, is_exported, generator=True)
+        elif node_type in ("class_declaration", "class"):
+            self._extract_class(node, source, file_path, symbols, parent_name, is_exported)
+        elif node_type in ("lexical_declaration", "variable_declaration"):
+            self._extract_variable_decl(node, source, file_path, symbols, parent_name, is_exported)
+        elif node_type == "expression_statement":
+            self._extract_module_exports(node, source, symbols, parent_name)
+        else:
+            # export_statement: its children are walked with the export flag set
+            return False
+        return True
 
     def _extract_function(self, node, source, symbols, parent_name, is_exported, generator=False):
         name_node = node.child_by_field_name("name")
@@ -101,20 +293,28 @@ class JavaScriptExtractor(LanguageExtractor):
             name = self.node_text(name_node, source)
         sig = f"class {name}"
         qualified = f"{parent_name}.{name}" if parent_name else name
+        line_start = node.start_point[0] + 1
 
-        # Check for extends/implements
+        # Check for extends/implements, and find the body in the same pass
+        body = None
         for child in node.children:
-            if child.type == "class_heritage":
-                sig += f" {self.node_text(child, source)}"
+            child_type = child.type
+            if child_type == "class_body":
+                body = child
+            elif child_type == "class_heritage":
+                node_text = self.node_text
+                make_reference = self._make_reference
+                inherit = self._state.pending_inherits.append
+                sig += f" {node_text(child, source)}"
                 for sub in child.children:
                     if sub.type == "extends_clause":
                         # TS: extends_clause > identifier or type_identifier
                         for exn in sub.children:
                             if exn.type in ("identifier", "type_identifier"):
-                                self._pending_inherits.append(self._make_reference(
-                                    target_name=self.node_text(exn, source),
+                                inherit(make_reference(
+                                    target_name=node_text(exn, source),
                                     kind="inherits",
-                                    line=node.start_point[0] + 1,
+                                    line=line_start,
                                     source_name=qualified,
                                 ))
                                 break
@@ -122,25 +322,24 @@ class JavaScriptExtractor(LanguageExtractor):
                         # TS: implements_clause > type_identifier (can be multiple)
                         for imp in sub.children:
                             if imp.type in ("type_identifier", "identifier"):
-                                self._pending_inherits.append(self._make_reference(
-                                    target_name=self.node_text(imp, source),
+                                inherit(make_reference(
+                                    target_name=node_text(imp, source),
                                     kind="implements",
-                                    line=node.start_point[0] + 1,
+                                    line=line_start,
                                     source_name=qualified,
                                 ))
                     elif sub.type == "identifier":
                         # Plain JS: class_heritage > identifier (no extends_clause wrapper)
-                        self._pending_inherits.append(self._make_reference(
-                            target_name=self.node_text(sub, source),
+                        inherit(make_reference(
+                            target_name=node_text(sub, source),
                             kind="inherits",
-                            line=node.start_point[0] + 1,
+                            line=line_start,
                             source_name=qualified,
                         ))
-                break
         symbols.append(self._make_symbol(
             name=name,
             kind="class",
-            line_start=node.start_point[0] + 1,
+            line_start=line_start,
             line_end=node.end_point[0] + 1,
             qualified_name=qualified,
             signature=sig,
@@ -150,18 +349,21 @@ class JavaScriptExtractor(LanguageExtractor):
         ))
 
         # Walk class body for methods
-        body = node.child_by_field_name("body")
-        if body:
+        if body is not None:
             self._extract_class_members(body, source, symbols, qualified)
 
     def _extract_class_members(self, body_node, source, symbols, class_name):
+        make_symbol = self._make_symbol
+        node_text = self.node_text
+        append = symbols.append
+        prefix = class_name + "."
         for child in body_node.children:
             if child.type in ("method_definition", "public_field_definition", "field_definition"):
                 name_node = child.child_by_field_name("name")
                 if name_node is None:
                     continue
-                name = self.node_text(name_node, source)
-                qualified = f"{class_name}.{name}"
+                name = node_text(name_node, source)
+                qualified = prefix + name
 
                 if child.type == "method_definition":
                     params = child.child_by_field_name("parameters")
@@ -170,17 +372,18 @@ class JavaScriptExtractor(LanguageExtractor):
                     # Check for static/async/get/set
                     prefixes = []
                     for sub in child.children:
-                        if sub.type in ("static", "async", "get", "set") or self.node_text(sub, source) in ("static", "async", "get", "set"):
-                            if sub == name_node:
-                                continue
-                            t = self.node_text(sub, source)
-                            if t in ("static", "async", "get", "set"):
-                                prefixes.append(t)
+                        start = sub.start_byte
+                        end = sub.end_byte
+                        if end - start > _METHOD_MODIFIER_MAX_LEN:
+                            continue
+                        text = source[start:end]
+                        if text in _METHOD_MODIFIERS and sub != name_node:
+                            prefixes.append(text.decode())
                     if prefixes:
                         sig = " ".join(prefixes) + " " + sig
 
                     kind = "constructor" if name == "constructor" else "method"
-                    symbols.append(self._make_symbol(
+                    append(make_symbol(
                         name=name,
                         kind=kind,
                         line_start=child.start_point[0] + 1,
@@ -192,7 +395,7 @@ class JavaScriptExtractor(LanguageExtractor):
                     ))
                 else:
                     # Field/property
-                    symbols.append(self._make_symbol(
+                    append(make_symbol(
                         name=name,
                         kind="property",
                         line_start=child.start_point[0] + 1,
@@ -204,77 +407,82 @@ class JavaScriptExtractor(LanguageExtractor):
     def _extract_variable_decl(self, node, source, file_path, symbols, parent_name, is_exported):
         """Extract const/let/var declarations, detecting function values."""
         decl_kind_text = ""
+        # Every declarator shares the span of the whole declaration
+        line_start = node.start_point[0] + 1
+        line_end = node.end_point[0] + 1
+        prefix = f"{parent_name}." if parent_name else ""
         for child in node.children:
-            if child.type in ("const", "let", "var") or self.node_text(child, source) in ("const", "let", "var"):
-                decl_kind_text = self.node_text(child, source)
-                break
-
-        for child in node.children:
-            if child.type == "variable_declarator":
-                name_node = child.child_by_field_name("name")
-                value_node = child.child_by_field_name("value")
-                if name_node is None:
-                    continue
-
-                # Handle destructured bindings: const { a, b } = ... or const [a, b] = ...
-                if name_node.type in ("object_pattern", "array_pattern"):
-                    self._extract_destructured(
-                        name_node, node, source, symbols,
-                        parent_name, is_exported, decl_kind_text, value_node,
-                    )
-                    continue
-
-                name = self.node_text(name_node, source)
-                qualified = f"{parent_name}.{name}" if parent_name else name
+            child_type = child.type
+            if child_type != "variable_declarator":
+                # The const/let/var keyword comes before every declarator;
+                # its anonymous node type is the keyword itself
+                if not decl_kind_text and child_type in _DECL_KEYWORDS:
+                    decl_kind_text = child_type
+                continue
+            name_node = child.child_by_field_name("name")
+            value_node = child.child_by_field_name("value")
+            if name_node is None:
+                continue
 
-                # Check if value is a function
-                if value_node and value_node.type in ("arrow_function", "function_expression", "generator_function"):
-                    params = value_node.child_by_field_name("parameters")
-                    p_text = self._params_text(params, source)
-                    if value_node.type == "arrow_function":
-                        sig = f"const {name} = ({p_text}) =>"
-                    else:
-                        sig = f"const {name} = function({p_text})"
+            # Handle destructured bindings: const { a, b } = ... or const [a, b] = ...
+            if name_node.type in ("object_pattern", "array_pattern"):
+                self._extract_destructured(
+                    name_node, node, source, symbols,
+                    parent_name, is_exported, decl_kind_text, line_start, line_end,
+                )
+                continue
 
-                    symbols.append(self._make_symbol(
-                        name=name,
-                        kind="function",
-                        line_start=node.start_point[0] + 1,
-                        line_end=node.end_point[0] + 1,
-                        qualified_name=qualified,
-                        signature=sig,
-                        docstring=self.get_docstring(node, source),
-                        is_exported=is_exported,
-                        parent_name=parent_name,
-                    ))
-                elif value_node and value_node.type == "class":
-                    # const Foo = class { ... }
-                    sig = f"const {name} = class"
-                    symbols.append(self._make_symbol(
-                        name=name,
-                        kind="class",
-                        line_start=node.start_point[0] + 1,
-                        line_end=node.end_point[0] + 1,
-                        qualified_name=qualified,
-                        signature=sig,
-                        is_exported=is_exported,
-                        parent_name=parent_name,
-                    ))
+            name = self.node_text(name_node, source)
+            qualified = prefix + name
+
+            # Check if value is a function
+            if value_node and value_node.type in ("arrow_function", "function_expression", "generator_function"):
+                params = value_node.child_by_field_name("parameters")
+                p_text = self._params_text(params, source)
+                if value_node.type == "arrow_function":
+                    sig = f"const {name} = ({p_text}) =>"
                 else:
-                    kind = "constant" if decl_kind_text == "const" else "variable"
-                    val_text = self.node_text(value_node, source)[:80] if value_node else ""
-                    sig = f"{decl_kind_text} {name}" + (f" = {val_text}" if val_text else "")
+                    sig = f"const {name} = function({p_text})"
 
-                    symbols.append(self._make_symbol(
-                        name=name,
-                        kind=kind,
-                        line_start=node.start_point[0] + 1,
-                        line_end=node.end_point[0] + 1,
-                        qualified_name=qualified,
-                        signature=sig,
-                        is_exported=is_exported,
-                        parent_name=parent_name,
-                    ))
+                symbols.append(self._make_symbol(
+                    name=name,
+                    kind="function",
+                    line_start=line_start,
+                    line_end=line_end,
+                    qualified_name=qualified,
+                    signature=sig,
+                    docstring=self.get_docstring(node, source),
+                    is_exported=is_exported,
+                    parent_name=parent_name,
+                ))
+            elif value_node and value_node.type == "class":
+                # const Foo = class { ... }
+                sig = f"const {name} = class"
+                symbols.append(self._make_symbol(
+                    name=name,
+                    kind="class",
+                    line_start=line_start,
+                    line_end=line_end,
+                    qualified_name=qualified,
+                    signature=sig,
+                    is_exported=is_exported,
+                    parent_name=parent_name,
+                ))
+            else:
+                kind = "constant" if decl_kind_text == "const" else "variable"
+                val_text = self._text_prefix(value_node, source, 80)
+                sig = f"{decl_kind_text} {name}" + (f" = {val_text}" if val_text else "")
+
+                symbols.append(self._make_symbol(
+                    name=name,
+                    kind=kind,
+                    line_start=line_start,
+                    line_end=line_end,
+                    qualified_name=qualified,
+                    signature=sig,
+                    is_exported=is_exported,
+                    parent_name=parent_name,
+                ))
 
     def _extract_module_exports(self, node, source, symbols, parent_name):
         """Detect module.exports/exports assignments and obj.method assignments."""
@@ -286,16 +494,12 @@ class JavaScriptExtractor(LanguageExtractor):
             if left is None or right is None:
                 continue
 
-            left_text = self.node_text(left, source)
-
             # --- Pattern: module.exports = X or exports = X ---
-            if left_text in ("module.exports", "exports"):
+            if source[left.start_byte:left.end_byte] in _EXPORT_TARGETS:
                 if right.type == "identifier":
                     name = self.node_text(right, source)
                     # Mark existing symbol as exported (don't duplicate)
-                    for sym in symbols:
-                        if sym["name"] == name:
-                            sym["is_exported"] = True
+                    self._mark_exported(symbols, name)
                 elif right.type == "object":
                     # module.exports = { handle(req) {}, query: function() {} }
                     self._extract_object_export_members(right, source, symbols)
@@ -307,25 +511,24 @@ class JavaScriptExtractor(LanguageExtractor):
                 prop_node = left.child_by_field_name("property")
                 if obj_node is None or prop_node is None:
                     continue
-                obj_text = self.node_text(obj_node, source)
                 prop_name = self.node_text(prop_node, source)
 
                 # Check for View.prototype.method pattern
                 if obj_node.type == "member_expression":
                     inner_obj = obj_node.child_by_field_name("object")
                     inner_prop = obj_node.child_by_field_name("property")
-                    if inner_prop and self.node_text(inner_prop, source) == "prototype" and inner_obj:
-                        obj_text = self.node_text(inner_obj, source)
+                    if (inner_prop and inner_obj
+                            and source[inner_prop.start_byte:inner_prop.end_byte] == b"prototype"):
                         # View.prototype.lookup = function(...) -> parent=View, name=lookup
+                        obj_node = inner_obj
+                obj_text = self.node_text(obj_node, source)
 
                 is_exports = obj_text in ("exports", "module.exports")
 
                 # Guard: if right is an identifier matching an existing symbol, just mark exported
                 if right.type == "identifier" and is_exports:
                     rname = self.node_text(right, source)
-                    for sym in symbols:
-                        if sym["name"] == rname:
-                            sym["is_exported"] = True
+                    self._mark_exported(symbols, rname)
                     continue
 
                 # Extract function or value
@@ -347,7 +550,7 @@ class JavaScriptExtractor(LanguageExtractor):
                     ))
                 else:
                     # Non-function value: exports.version = "1.0"
-                    val_text = self.node_text(right, source)[:80]
+                    val_text = self._text_prefix(right, source, 80)
                     qualified = f"{obj_text}.{prop_name}"
                     sig = f"{obj_text}.{prop_name} = {val_text}"
                     symbols.append(self._make_symbol(
@@ -361,6 +564,18 @@ class JavaScriptExtractor(LanguageExtractor):
                         parent_name=obj_text,
                     ))
 
+    def _mark_exported(self, symbols, name):
+        """Mark every symbol extracted so far that is called *name* as exported."""
+        # Index symbols appended since the last lookup, so repeated
+        # exports stay linear in the number of symbols
+        state = self._state
+        index = state.symbols_by_name
+        for sym in symbols[state.symbols_indexed:]:
+            index.setdefault(sym["name"], []).append(sym)
+        state.symbols_indexed = len(symbols)
+        for sym in index.get(name, ()):
+            sym["is_exported"] = True
+
     def _extract_object_export_members(self, obj_node, source, symbols):
         """Extract members from module.exports = { ... } object literal."""
         for child in obj_node.children:
@@ -401,7 +616,7 @@ class JavaScriptExtractor(LanguageExtractor):
                         parent_name="exports",
                     ))
                 else:
-                    val_text = self.node_text(value_node, source)[:80]
+                    val_text = self._text_prefix(value_node, source, 80)
                     symbols.append(self._make_symbol(
                         name=name,
                         kind="constant",
@@ -415,23 +630,22 @@ class JavaScriptExtractor(LanguageExtractor):
             elif child.type == "shorthand_property_identifier":
                 # { existingVar } — mark matching symbol as exported
                 name = self.node_text(child, source)
-                for sym in symbols:
-                    if sym["name"] == name:
-                        sym["is_exported"] = True
+                self._mark_exported(symbols, name)
 
     def _extract_destructured(self, pattern_node, decl_node, source, symbols,
-                              parent_name, is_exported, decl_kind, value_node):
+                              parent_name, is_exported, decl_kind, line_start, line_end):
         """Extract individual bindings from destructured patterns."""
         names = self._collect_pattern_names(pattern_node, source)
         kind = "constant" if decl_kind == "const" else "variable"
+        prefix = f"{parent_name}." if parent_name else ""
         for name in names:
-            qualified = f"{parent_name}.{name}" if parent_name else name
+            qualified = prefix + name
             sig = f"{decl_kind} {name}"
             symbols.append(self._make_symbol(
                 name=name,
                 kind=kind,
-                line_start=decl_node.start_point[0] + 1,
-                line_end=decl_node.end_point[0] + 1,
+                line_start=line_start,
+                line_end=line_end,
                 qualified_name=qualified,
                 signature=sig,
                 is_exported=is_exported,
@@ -441,72 +655,103 @@ class JavaScriptExtractor(LanguageExtractor):
     def _collect_pattern_names(self, pattern_node, source):
         """Collect all identifier names from a destructuring pattern."""
         names = []
-        for child in pattern_node.children:
-            if child.type in ("shorthand_property_identifier_pattern",
-                              "shorthand_property_identifier",
-                              "identifier"):
-                names.append(self.node_text(child, source))
-            elif child.type == "pair_pattern":
-                # { key: localVar } — extract the local binding
-                value = child.child_by_field_name("value")
-                if value:
-                    if value.type == "identifier":
-                        names.append(self.node_text(value, source))
-                    elif value.type in ("object_pattern", "array_pattern"):
-                        names.extend(self._collect_pattern_names(value, source))
-            elif child.type == "rest_pattern":
-                for sub in child.children:
-                    if sub.type == "identifier":
-                        names.append(self.node_text(sub, source))
-            elif child.type == "assignment_pattern":
-                # { x = defaultValue } — extract x
-                left = child.child_by_field_name("left")
-                if left:
-                    if left.type == "identifier":
-                        names.append(self.node_text(left, source))
-                    elif left.type in ("shorthand_property_identifier_pattern",
-                                       "shorthand_property_identifier"):
-                        names.append(self.node_text(left, source))
-            elif child.type in ("object_pattern", "array_pattern"):
-                names.extend(self._collect_pattern_names(child, source))
+        append = names.append
+        node_text = self.node_text
+        # Explicit stack of child iterators instead of recursing into
+        # nested patterns; names still come out in source order
+        stack = [iter(pattern_node.children)]
+        while stack:
+            for child in stack[-1]:
+                child_type = child.type
+                if child_type in _IDENTIFIER_PATTERNS:
+                    append(node_text(child, source))
+                elif child_type == "pair_pattern":
+                    # { key: localVar } — extract the local binding
+                    value = child.child_by_field_name("value")
+                    if value:
+                        if value.type == "identifier":
+                            append(node_text(value, source))
+                        elif value.type in ("object_pattern", "array_pattern"):
+                            stack.append(iter(value.children))
+                            break
+                elif child_type == "rest_pattern":
+                    for sub in child.children:
+                        if sub.type == "identifier":
+                            append(node_text(sub, source))
+                elif child_type == "assignment_pattern":
+                    # { x = defaultValue } — extract x
+                    left = child.child_by_field_name("left")
+                    if left and left.type in _IDENTIFIER_PATTERNS:
+                        append(node_text(left, source))
+                elif child_type in ("object_pattern", "array_pattern"):
+                    stack.append(iter(child.children))
+                    break
+            else:
+                stack.pop()
         return names
 
     # ---- Reference extraction ----
 
-    # JS keywords to skip when extracting identifier references from arguments
-    _JS_KEYWORDS = frozenset({
-        "true", "false", "null", "undefined", "this", "super", "arguments",
-        "new", "void", "typeof", "instanceof", "in", "of", "async", "await",
-        "yield", "return", "throw", "delete", "NaN", "Infinity",
-    })
-
-    def _walk_refs(self, node, source, refs, scope_name):
-        for child in node.children:
-            if child.type == "import_statement":
+    def _walk_refs(self, node, source, refs, scope_name, kinds, fields):
+        # Iterative pre-order walk with a TreeCursor.  Each ``frames`` entry
+        # is (scope_name, parent_is_arguments) for one depth below ``node``.
+        # ``kinds`` maps kind ids to the names in _REF_NODE_KINDS and
+        # _REF_PRUNE_KINDS, ``fields`` the _REF_FIELDS names to field ids.
+        cursor = node.walk()
+        node_text = self.node_text
+        make_reference = self._make_reference
+        append = refs.append
+        prune_kinds = self._REF_PRUNE_KINDS
+        if not cursor.goto_first_child():
+            return
+        frames = [(scope_name, kinds.get(node.kind_id) == "arguments")]
+        while True:
+            child = cursor.node
+            child_type = kinds.get(child.kind_id)
+            scope_name, in_arguments = frames[-1]
+            new_scope = scope_name
+            descend = False
+            if child_type is None:
+                descend = True
+            elif child_type == "identifier":
+                # Identifiers are by far the most common kind here, so they
+                # are tested first; they are leaves, so nothing to descend
+                if in_arguments:
+                    # Bug 2: Identifiers passed as function arguments (callbacks by reference)
+                    # e.g. addEventListener('keydown', handleKeyboardShortcut)
+                    # Keywords are filtered on the raw bytes, so only
+                    # names that become references are decoded
+                    text = source[child.start_byte:child.end_byte]
+                    if text and text not in _JS_KEYWORDS:
+                        append(make_reference(
+                            target_name=text.decode("utf-8", errors="replace"),
+                            kind="reference",
+                            line=child.start_point[0] + 1,
+                            source_name=scope_name,
+                        ))
+            elif child_type in prune_kinds:
+                pass
+            elif child_type == "import_statement":
                 self._extract_esm_import(child, source, refs, scope_name)
-            elif child.type == "export_statement":
-                self._walk_refs(child, source, refs, scope_name)
-            elif child.type == "call_expression":
-                self._extract_call(child, source, refs, scope_name)
-            elif child.type == "new_expression":
-                self._extract_new(child, source, refs, scope_name)
-            elif child.type == "identifier" and node.type == "arguments":
-                # Bug 2: Identifiers passed as function arguments (callbacks by reference)
-                # e.g. addEventListener('keydown', handleKeyboardShortcut)
-                name = self.node_text(child, source)
-                if name and name not in self._JS_KEYWORDS:
-                    refs.append(self._make_reference(
-                        target_name=name,
-                        kind="reference",
-                        line=child.start_point[0] + 1,
-                        source_name=scope_name,
-                    ))
-            elif child.type == "shorthand_property_identifier":
+            elif child_type == "export_statement":
+                descend = True
+            elif child_type == "call_expression" or child_type == "new_expression":
+                if child_type == "call_expression":
+                    args = self._extract_call(child, source, refs, scope_name, fields)
+                else:
+                    args = self._extract_new(child, source, refs, scope_name, fields)
+                # Carry on into the arguments (always the last child) for
+                # nested calls, skipping the callee.  Continuing with the
+                # same cursor keeps deeply nested calls off the Python stack
+                if args is not None and cursor.goto_first_child_for_byte(args.start_byte) is not None:
+                    frames.append((scope_name, False))
+                    continue
+            elif child_type == "shorthand_property_identifier":
                 # Bug 3: Shorthand properties are always variable references
                 # e.g. defineExpose({ resetForm, populateFromKinisi })
-                name = self.node_text(child, source)
+                name = node_text(child, source)
                 if name:
-                    refs.append(self._make_reference(
+                    append(make_reference(
                         target_name=name,
                         kind="reference",
                         line=child.start_point[0] + 1,
@@ -514,22 +759,30 @@ class JavaScriptExtractor(LanguageExtractor):
                     ))
                 # No recursion needed — shorthand_property_identifier is a leaf node
             else:
-                new_scope = scope_name
-                if child.type in ("function_declaration", "class_declaration", "generator_function_declaration"):
+                descend = True
+                if child_type in ("function_declaration", "class_declaration", "generator_function_declaration"):
                     n = child.child_by_field_name("name")
                     if n:
-                        fname = self.node_text(n, source)
+                        fname = node_text(n, source)
                         new_scope = f"{scope_name}.{fname}" if scope_name else fname
-                elif child.type in ("lexical_declaration", "variable_declaration"):
+                elif child_type in ("lexical_declaration", "variable_declaration"):
                     # Track const/let/var declarations as scope for their initializers
                     for sub in child.children:
                         if sub.type == "variable_declarator":
                             n = sub.child_by_field_name("name")
                             if n and n.type == "identifier":
-                                vname = self.node_text(n, source)
+                                vname = node_text(n, source)
                                 new_scope = f"{scope_name}.{vname}" if scope_name else vname
                                 break
-                self._walk_refs(child, source, refs, new_scope)
+
+            if descend and cursor.goto_first_child():
+                frames.append((new_scope, child_type == "arguments"))
+                continue
+            while not cursor.goto_next_sibling():
+                if len(frames) == 1:
+                    return
+                cursor.goto_parent()
+                frames.pop()
 
     def _extract_esm_import(self, node, source, refs, scope_name):
         """Extract ESM import statements.
@@ -545,22 +798,24 @@ class JavaScriptExtractor(LanguageExtractor):
         path = self.node_text(source_node, source).strip("'\"")
 
         # Collect imported names
+        node_text = self.node_text
         names = []
+        append = names.append
         for child in node.children:
             if child.type == "import_clause":
                 for sub in child.children:
                     if sub.type == "identifier":
-                        names.append(self.node_text(sub, source))
+                        append(node_text(sub, source))
                     elif sub.type == "named_imports":
                         for spec in sub.children:
                             if spec.type == "import_specifier":
                                 name_node = spec.child_by_field_name("name")
                                 if name_node:
-                                    names.append(self.node_text(name_node, source))
+                                    append(node_text(name_node, source))
                     elif sub.type == "namespace_import":
                         for ns_child in sub.children:
                             if ns_child.type == "identifier":
-                                names.append(self.node_text(ns_child, source))
+                                append(node_text(ns_child, source))
 
         # Resolve Salesforce @salesforce/* imports to meaningful target names
         sf_target = self._resolve_salesforce_import_target(path)
@@ -572,13 +827,14 @@ class JavaScriptExtractor(LanguageExtractor):
         else:
             edge_kind = "import"
 
+        line = node.start_point[0] + 1
         if names:
             for name in names:
                 target = sf_target if sf_target else name
                 refs.append(self._make_reference(
                     target_name=target,
                     kind=edge_kind,
-                    line=node.start_point[0] + 1,
+                    line=line,
                     source_name=scope_name,
                     import_path=path,
                 ))
@@ -590,7 +846,7 @@ class JavaScriptExtractor(LanguageExtractor):
                     refs.append(self._make_reference(
                         target_name=class_name,
                         kind="call",
-                        line=node.start_point[0] + 1,
+                        line=line,
                         source_name=scope_name,
                         import_path=path,
                     ))
@@ -599,16 +855,18 @@ class JavaScriptExtractor(LanguageExtractor):
             refs.append(self._make_reference(
                 target_name=sf_target if sf_target else path,
                 kind=edge_kind,
-                line=node.start_point[0] + 1,
+                line=line,
                 source_name=scope_name,
                 import_path=path,
             ))
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _resolve_salesforce_import_target(path: str) -> str | None:
         """Map a @salesforce/* import path to a symbol target name.
 
-        Returns None for non-Salesforce paths.
+        Returns None for non-Salesforce paths.  Cached, as LWC components
+        across a project import the same few hundred paths.
         """
         if not path.startswith("@salesforce/"):
             return None
@@ -627,65 +885,57 @@ class JavaScriptExtractor(LanguageExtractor):
             return path[len("@salesforce/messageChannel/"):]
         return None
 
-    def _extract_call(self, node, source, refs, scope_name):
-        func_node = node.child_by_field_name("function")
+    def _extract_call(self, node, source, refs, scope_name, fields):
+        func_node = node.child_by_field_id(fields["function"])
         if func_node is None:
-            return
+            return None
 
         # Handle method calls: obj.method() -> extract "method"
+        name_node = func_node
         if func_node.type == "member_expression":
-            prop = func_node.child_by_field_name("property")
+            prop = func_node.child_by_field_id(fields["property"])
             if prop:
-                name = self.node_text(prop, source)
-            else:
-                name = self.node_text(func_node, source)
-        else:
-            name = self.node_text(func_node, source)
+                name_node = prop
 
-        # Special handling for require() - use module name as target
-        if name == "require":
-            args = node.child_by_field_name("arguments")
+        # Special handling for require() - use module name as target.
+        # Matched on the raw bytes, before the callee name is decoded
+        start, end = name_node.start_byte, name_node.end_byte
+        if end - start == 7 and source[start:end] == b"require":
+            args = node.child_by_field_id(fields["arguments"])
             if args:
                 for arg_child in args.children:
                     if arg_child.type == "string":
                         path = self.node_text(arg_child, source).strip("'\"")
-                        # Use last path segment as target name
-                        target = path.rsplit("/", 1)[-1] if "/" in path else path
-                        # Strip .js/.json extension
-                        for ext in (".js", ".json", ".mjs", ".cjs"):
-                            if target.endswith(ext):
-                                target = target[:-len(ext)]
-                                break
                         refs.append(self._make_reference(
-                            target_name=target,
+                            target_name=_require_target(path),
                             kind="import",
                             line=node.start_point[0] + 1,
                             source_name=scope_name,
                             import_path=path,
                         ))
-                        return
+                        return None
 
         refs.append(self._make_reference(
-            target_name=name,
+            target_name=self.node_text(name_node, source),
             kind="call",
             line=node.start_point[0] + 1,
             source_name=scope_name,
         ))
 
-        # Recurse into arguments for nested calls
-        args = node.child_by_field_name("arguments")
-        if args:
-            self._walk_refs(args, source, refs, scope_name)
+        # Return the arguments node; _walk_refs moves its cursor onto it
+        # (goto_first_child_for_byte) to find nested calls, so nothing
+        # here walks the arguments
+        return node.child_by_field_id(fields["arguments"])
 
-    def _extract_new(self, node, source, refs, scope_name):
+    def _extract_new(self, node, source, refs, scope_name, fields):
         """Extract new expressions: new Foo(), new module.Foo()."""
-        ctor = node.child_by_field_name("constructor")
+        ctor = node.child_by_field_id(fields["constructor"])
         if ctor is None:
-            return
+            return None
 
         # Handle new module.Foo() -> extract "Foo"
         if ctor.type == "member_expression":
-            prop = ctor.child_by_field_name("property")
+            prop = ctor.child_by_field_id(fields["property"])
             if prop:
                 name = self.node_text(prop, source)
             else:
@@ -700,7 +950,7 @@ class JavaScriptExtractor(LanguageExtractor):
             source_name=scope_name,
         ))
 
-        # Recurse into arguments for nested calls/refs
-        args = node.child_by_field_name("arguments")
-        if args:
-            self._walk_refs(args, source, refs, scope_name)
+        # Return the arguments node; _walk_refs moves its cursor onto it
+        # (goto_first_child_for_byte) to find nested calls and refs, so
+        # nothing here walks the arguments
+        return node.child_by_field_id(fields["arguments"])
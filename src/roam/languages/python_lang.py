@@ -247,7 +247,7 @@ class PythonExtractor(LanguageExtractor):
             return
 
         right = node.child_by_field_name("right")
-        sig = f"{name} = {self.node_text(right, source)[:80]}" if right else name
+        sig = f"{name} = {self._text_prefix(right, source, 80)}" if right else name
 
         # Check if it looks like a constant (ALL_CAPS)
         kind = "constant" if name.isupper() or (name.upper() == name and "_" in name) else "variable"
@@ -298,14 +298,15 @@ class PythonExtractor(LanguageExtractor):
         literal_types = {"string", "integer", "float", "true", "false",
                          "none", "None", "concatenated_string"}
         if node.type in literal_types:
-            text = self.node_text(node, source)
-            return text[:200] if len(text) <= 200 else None
+            # One character past the limit tells whether it fits
+            text = self._text_prefix(node, source, 201)
+            return text if len(text) <= 200 else None
         # String with string_content child
         if node.type == "string":
             for child in node.children:
                 if child.type == "string_content":
                     return self.node_text(child, source)
-            return self.node_text(node, source)[:200]
+            return self._text_prefix(node, source, 200)
         # Unary minus for negative numbers
         if node.type == "unary_operator":
             op = self.node_text(node, source)
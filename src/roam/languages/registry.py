@@ -87,8 +87,7 @@ def get_language_for_file(path: str) -> str | None:
     lower = path.lower()
     if lower.endswith("-meta.xml"):
         return "sfxml"
-    _, ext = os.path.splitext(path)
-    ext = ext.lower()
+    _, ext = os.path.splitext(lower)
     return _EXTENSION_MAP.get(ext)
 
 
@@ -99,9 +98,13 @@ def _is_salesforce_path(path: str) -> bool:
     return bool(sf_dirs & set(parts))
 
 
+@lru_cache(maxsize=None)
 def get_ts_language(language: str):
     """Get a tree-sitter Language object from tree_sitter_language_pack.
 
+    Each language is loaded once; Language objects are immutable and can
+    be shared, unlike Parsers (see ``roam.index.parser._get_parser``).
+
     Args:
         language: Language name (e.g. 'python', 'javascript', 'c_sharp')
 
@@ -121,6 +124,22 @@ def get_ts_language(language: str):
     return get_language(grammar_name)
 
 
+@lru_cache(maxsize=None)
+def xml_kind_id(kind: str) -> int:
+    """Kind id of named *kind* nodes in the xml grammar.
+
+    The Salesforce extractors all read xml trees and dispatch on these ids
+    rather than on ``node.type``, which builds a new string per access.
+    """
+    return get_ts_language("sfxml").id_for_node_kind(kind, True)
+
+
+@lru_cache(maxsize=None)
+def xml_tag_kind_ids() -> frozenset[int]:
+    """Kind ids of xml start, end and empty-element tags."""
+    return frozenset(xml_kind_id(kind) for kind in ("STag", "ETag", "EmptyElemTag"))
+
+
 @lru_cache(maxsize=None)
 def _create_extractor(language: str) -> "LanguageExtractor":
     """Create and cache an extractor instance for a language."""
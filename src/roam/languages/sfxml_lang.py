@@ -18,6 +18,7 @@ relationships between Apex code and declarative configuration.
 import re
 
 from .base import LanguageExtractor
+from .registry import xml_kind_id, xml_tag_kind_ids
 
 
 # XML element names that represent named Salesforce metadata entities.
@@ -206,68 +207,87 @@ class SalesforceXmlExtractor(LanguageExtractor):
 
     def _walk_xml(self, node, source: bytes, symbols: list[dict], parent_name, file_path: str):
         """Walk XML AST and extract Salesforce metadata elements as symbols."""
-        if node.type == "element":
-            tag_name = self._get_element_tag(node, source)
-            if tag_name and tag_name in _SF_METADATA_ELEMENTS:
-                kind = _SF_METADATA_ELEMENTS[tag_name]
-                # Track root element type for sidecar detection
-                if parent_name is None:
-                    self._root_type = tag_name
-                # Try to find the name of this metadata element
-                elem_name = self._get_child_text(node, source, "fullName")
-                if not elem_name:
-                    elem_name = self._get_child_text(node, source, "apiName")
-                if not elem_name:
-                    elem_name = self._get_child_text(node, source, "label")
-                if not elem_name:
-                    elem_name = self._get_child_text(node, source, "masterLabel")
-                if not elem_name:
-                    # Use tag name as a fallback only for root-level types
+        # Iterative pre-order walk with a TreeCursor, so no Python frame
+        # or children list is built per node.  ``parents`` holds the
+        # parent_name for each depth from ``node`` down.  Start and end
+        # tags never hold elements, so they are not descended into.
+        cursor = node.walk()
+        element = xml_kind_id("element")
+        tag_kinds = xml_tag_kind_ids()
+        parents = [parent_name]
+        while True:
+            node = cursor.node
+            parent_name = parents[-1]
+            kind_id = node.kind_id
+            descend = kind_id not in tag_kinds
+            if kind_id == element:
+                tag_name = self._get_element_tag(node, source)
+                kind = _SF_METADATA_ELEMENTS.get(tag_name) if tag_name else None
+                if kind is not None:
+                    # Track root element type for sidecar detection
                     if parent_name is None:
-                        elem_name = self._derive_name_from_path(file_path)
-                    else:
-                        elem_name = tag_name
-
-                qualified = f"{parent_name}.{elem_name}" if parent_name else elem_name
-
-                # Get description/help text if available
-                description = self._get_child_text(node, source, "description")
-                if not description:
-                    description = self._get_child_text(node, source, "inlineHelpText")
-
-                # Build a useful signature
-                sig = f"{tag_name}: {elem_name}"
-                field_type = self._get_child_text(node, source, "type")
-                if field_type:
-                    sig += f" ({field_type})"
-                required = self._get_child_text(node, source, "required")
-                if required and required.lower() == "true":
-                    sig += " [required]"
-
-                symbols.append(self._make_symbol(
-                    name=elem_name,
-                    kind=kind,
-                    line_start=node.start_point[0] + 1,
-                    line_end=node.end_point[0] + 1,
-                    qualified_name=qualified,
-                    signature=sig,
-                    docstring=description,
-                    visibility="public",
-                    is_exported=True,
-                    parent_name=parent_name,
-                ))
-
-                # For container elements, recurse with this as parent
-                if kind == "class":
-                    content = self._get_content_node(node)
-                    if content:
-                        for child in content.children:
-                            self._walk_xml(child, source, symbols, parent_name=qualified, file_path=file_path)
-                    return  # Don't double-recurse
-
-        # Recurse into children
-        for child in node.children:
-            self._walk_xml(child, source, symbols, parent_name=parent_name, file_path=file_path)
+                        self._root_type = tag_name
+                    # Try to find the name of this metadata element
+                    elem_name = self._get_child_text(node, source, "fullName")
+                    if not elem_name:
+                        elem_name = self._get_child_text(node, source, "apiName")
+                    if not elem_name:
+                        elem_name = self._get_child_text(node, source, "label")
+                    if not elem_name:
+                        elem_name = self._get_child_text(node, source, "masterLabel")
+                    if not elem_name:
+                        # Use tag name as a fallback only for root-level types
+                        if parent_name is None:
+                            elem_name = self._derive_name_from_path(file_path)
+                        else:
+                            elem_name = tag_name
+
+                    qualified = f"{parent_name}.{elem_name}" if parent_name else elem_name
+
+                    # Get description/help text if available
+                    description = self._get_child_text(node, source, "description")
+                    if not description:
+                        description = self._get_child_text(node, source, "inlineHelpText")
+
+                    # Build a useful signature
+                    sig = f"{tag_name}: {elem_name}"
+                    field_type = self._get_child_text(node, source, "type")
+                    if field_type:
+                        sig += f" ({field_type})"
+                    required = self._get_child_text(node, source, "required")
+                    if required and required.lower() == "true":
+                        sig += " [required]"
+
+                    symbols.append(self._make_symbol(
+                        name=elem_name,
+                        kind=kind,
+                        line_start=node.start_point[0] + 1,
+                        line_end=node.end_point[0] + 1,
+                        qualified_name=qualified,
+                        signature=sig,
+                        docstring=description,
+                        visibility="public",
+                        is_exported=True,
+                        parent_name=parent_name,
+                    ))
+
+                    # For container elements, walk only their content, with
+                    # this as parent.  Containers nest a level or two deep.
+                    if kind == "class":
+                        content = self._get_content_node(node)
+                        if content:
+                            for child in content.children:
+                                self._walk_xml(child, source, symbols, parent_name=qualified, file_path=file_path)
+                        descend = False
+
+            if descend and cursor.goto_first_child():
+                parents.append(parent_name)
+                continue
+            while not cursor.goto_next_sibling():
+                if len(parents) == 1:
+                    return
+                cursor.goto_parent()
+                parents.pop()
 
     def _walk_xml_refs(self, node, source: bytes, refs: list[dict], file_path: str,
                        parent_tag: str | None = None):
@@ -280,60 +300,76 @@ class SalesforceXmlExtractor(LanguageExtractor):
         Flow actionCalls with actionType=apex create "call" edges to Apex classes.
         Custom metadata values with class-reference fields create reference edges.
         """
-        if node.type == "element":
-            tag_name = self._get_element_tag(node, source)
-
-            if tag_name:
-                # P1C: Flow actionCalls — detect Apex invocable actions
-                if tag_name == "actionCalls":
-                    self._extract_action_call_refs(node, source, refs)
-
-                # P1F: Custom metadata values — detect class reference fields
-                elif tag_name == "values":
-                    self._extract_custom_metadata_class_refs(node, source, refs)
-
-                # Always-reference tags
-                elif tag_name in self._ALWAYS_REF_TAGS:
-                    text = self._get_element_text(node, source)
-                    if text:
-                        refs.append(self._make_reference(
-                            target_name=text,
-                            kind="reference",
-                            line=node.start_point[0] + 1,
-                        ))
-
-                # Context-dependent tags
-                elif tag_name in self._CONTEXT_REF_PARENTS:
-                    valid_parents = self._CONTEXT_REF_PARENTS[tag_name]
-                    if parent_tag and parent_tag in valid_parents:
+        # Iterative pre-order walk with a TreeCursor; ``tags`` holds the
+        # parent tag for each depth from ``node`` down.  Start and end
+        # tags never hold elements, so they are not descended into.
+        cursor = node.walk()
+        element = xml_kind_id("element")
+        tag_kinds = xml_tag_kind_ids()
+        tags = [parent_tag]
+        while True:
+            node = cursor.node
+            parent_tag = tags[-1]
+            kind_id = node.kind_id
+            if kind_id == element:
+                tag_name = self._get_element_tag(node, source)
+
+                if tag_name:
+                    # P1C: Flow actionCalls — detect Apex invocable actions
+                    if tag_name == "actionCalls":
+                        self._extract_action_call_refs(node, source, refs)
+
+                    # P1F: Custom metadata values — detect class reference fields
+                    elif tag_name == "values":
+                        self._extract_custom_metadata_class_refs(node, source, refs)
+
+                    # Always-reference tags
+                    elif tag_name in self._ALWAYS_REF_TAGS:
                         text = self._get_element_text(node, source)
                         if text:
-                            # "Account.Industry__c" → reference to Industry__c
-                            target = text.split(".")[-1] if "." in text else text
                             refs.append(self._make_reference(
-                                target_name=target,
+                                target_name=text,
                                 kind="reference",
                                 line=node.start_point[0] + 1,
                             ))
 
-                # Formula fields — scan for Object.Field__c patterns
-                elif tag_name in ("formula", "formulaText", "errorConditionFormula"):
-                    text = self._get_element_text(node, source)
-                    if text:
-                        self._extract_formula_refs(text, node.start_point[0] + 1, refs)
+                    # Context-dependent tags
+                    elif tag_name in self._CONTEXT_REF_PARENTS:
+                        valid_parents = self._CONTEXT_REF_PARENTS[tag_name]
+                        if parent_tag and parent_tag in valid_parents:
+                            text = self._get_element_text(node, source)
+                            if text:
+                                # "Account.Industry__c" → reference to Industry__c
+                                target = text.split(".")[-1] if "." in text else text
+                                refs.append(self._make_reference(
+                                    target_name=target,
+                                    kind="reference",
+                                    line=node.start_point[0] + 1,
+                                ))
+
+                    # Formula fields — scan for Object.Field__c patterns
+                    elif tag_name in ("formula", "formulaText", "errorConditionFormula"):
+                        text = self._get_element_text(node, source)
+                        if text:
+                            self._extract_formula_refs(text, node.start_point[0] + 1, refs)
 
-            # Recurse, passing current tag as parent context
-            for child in node.children:
-                self._walk_xml_refs(child, source, refs, file_path=file_path,
-                                    parent_tag=tag_name)
-            return
+                # Descend, passing current tag as parent context
+                parent_tag = tag_name
 
-        for child in node.children:
-            self._walk_xml_refs(child, source, refs, file_path=file_path,
-                               parent_tag=parent_tag)
+            if kind_id not in tag_kinds and cursor.goto_first_child():
+                tags.append(parent_tag)
+                continue
+            while not cursor.goto_next_sibling():
+                if len(tags) == 1:
+                    return
+                cursor.goto_parent()
+                tags.pop()
 
     def _extract_formula_refs(self, formula_text: str, line: int, refs: list[dict]):
         """Extract Object.Field__c references from Salesforce formula syntax."""
+        # Every match ends in __c or __r; most formulas have neither
+        if "__" not in formula_text:
+            return
         for m in self._FORMULA_FIELD_RE.finditer(formula_text):
             refs.append(self._make_reference(
                 target_name=m.group(2),  # Field API name
@@ -347,6 +383,13 @@ class SalesforceXmlExtractor(LanguageExtractor):
 
     def _get_element_tag(self, element_node, source: bytes) -> str | None:
         """Get the tag name from an XML element node."""
+        # The start tag (or empty-element tag) comes first in an element,
+        # with its Name right after the "<"; read it by position
+        tag = element_node.child(0)
+        if tag is not None and tag.kind_id in (xml_kind_id("STag"), xml_kind_id("EmptyElemTag")):
+            name = tag.child(1)
+            if name is not None and name.kind_id == xml_kind_id("Name"):
+                return self.node_text(name, source)
         # The element has STag (start tag) or EmptyElemTag children
         for child in element_node.children:
             if child.type in ("STag", "EmptyElemTag"):
@@ -1,5 +1,10 @@
 from .javascript_lang import JavaScriptExtractor
 
+# Access modifiers, compared as raw source bytes
+_VISIBILITY_MODIFIERS = frozenset((b"private", b"protected", b"public"))
+# Longer spans (e.g. a method body) are never sliced to test for a modifier
+_VISIBILITY_MODIFIER_MAX_LEN = max(map(len, _VISIBILITY_MODIFIERS))
+
 
 class TypeScriptExtractor(JavaScriptExtractor):
     """TypeScript extractor extending JavaScript with TS-specific constructs."""
@@ -12,32 +17,40 @@ class TypeScriptExtractor(JavaScriptExtractor):
     def file_extensions(self) -> list[str]:
         return [".ts", ".tsx", ".mts", ".cts"]
 
-    def _walk_symbols(self, node, source, file_path, symbols, parent_name, is_exported):
-        for child in node.children:
-            exported = is_exported or self._is_export_node(child)
-
-            if child.type == "function_declaration":
-                self._extract_function(child, source, symbols, parent_name, exported)
-            elif child.type == "generator_function_declaration":
-                self._extract_function(child, source, symbols, parent_name, exported, generator=True)
-            elif child.type == "class_declaration":
-                self._extract_class(child, source, file_path, symbols, parent_name, exported)
-            elif child.type in ("lexical_declaration", "variable_declaration"):
-                self._extract_variable_decl(child, source, file_path, symbols, parent_name, exported)
-            elif child.type == "export_statement":
-                self._walk_symbols(child, source, file_path, symbols, parent_name, is_exported=True)
-            elif child.type == "interface_declaration":
-                self._extract_interface(child, source, symbols, parent_name, exported)
-            elif child.type == "type_alias_declaration":
-                self._extract_type_alias(child, source, symbols, parent_name, exported)
-            elif child.type == "enum_declaration":
-                self._extract_enum(child, source, symbols, parent_name, exported)
-            elif child.type == "abstract_class_declaration":
-                self._extract_class(child, source, file_path, symbols, parent_name, exported)
-            elif child.type == "expression_statement":
-                self._extract_module_exports(child, source, symbols, parent_name)
-            else:
-                self._walk_symbols(child, source, file_path, symbols, parent_name, is_exported)
+    def _grammar_for(self, file_path: str) -> str:
+        return "tsx" if file_path.endswith(".tsx") else "typescript"
+
+    _SYMBOL_NODE_KINDS = JavaScriptExtractor._SYMBOL_NODE_KINDS + (
+        "interface_declaration", "type_alias_declaration", "enum_declaration",
+        "abstract_class_declaration",
+    )
+    # Type positions cannot declare symbols either
+    _SYMBOL_PRUNE_KINDS = JavaScriptExtractor._SYMBOL_PRUNE_KINDS + (
+        "type_annotation", "type_arguments", "type_parameters",
+    )
+
+    def _extract_symbol_node(self, node, node_type, source, file_path, symbols, parent_name, is_exported) -> bool:
+        if node_type == "function_declaration":
+            self._extract_function(node, source, symbols, parent_name, is_exported)
+        elif node_type == "generator_function_declaration":
+            self._extract_function(node, source, symbols, parent_name, is_exported, generator=True)
+        elif node_type == "class_declaration":
+            self._extract_class(node, source, file_path, symbols, parent_name, is_exported)
+        elif node_type in ("lexical_declaration", "variable_declaration"):
+            self._extract_variable_decl(node, source, file_path, symbols, parent_name, is_exported)
+        elif node_type == "interface_declaration":
+            self._extract_interface(node, source, symbols, parent_name, is_exported)
+        elif node_type == "type_alias_declaration":
+            self._extract_type_alias(node, source, symbols, parent_name, is_exported)
+        elif node_type == "enum_declaration":
+            self._extract_enum(node, source, symbols, parent_name, is_exported)
+        elif node_type == "abstract_class_declaration":
+            self._extract_class(node, source, file_path, symbols, parent_name, is_exported)
+        elif node_type == "expression_statement":
+            self._extract_module_exports(node, source, symbols, parent_name)
+        else:
+            return False
+        return True
 
     def _extract_interface(self, node, source, symbols, parent_name, is_exported):
         name_node = node.child_by_field_name("name")
@@ -76,21 +89,25 @@ class TypeScriptExtractor(JavaScriptExtractor):
             self._extract_interface_members(body, source, symbols, qualified)
 
     def _extract_interface_members(self, body_node, source, symbols, interface_name):
+        make_symbol = self._make_symbol
+        node_text = self.node_text
+        append = symbols.append
+        prefix = interface_name + "."
         for child in body_node.children:
             if child.type in ("property_signature", "method_signature"):
                 name_node = child.child_by_field_name("name")
                 if name_node is None:
                     continue
-                name = self.node_text(name_node, source)
-                qualified = f"{interface_name}.{name}"
+                name = node_text(name_node, source)
+                qualified = prefix + name
 
                 if child.type == "method_signature":
                     params = child.child_by_field_name("parameters")
                     sig = f"{name}({self._params_text(params, source)})"
                     ret = child.child_by_field_name("return_type")
                     if ret:
-                        sig += f": {self.node_text(ret, source)}"
-                    symbols.append(self._make_symbol(
+                        sig += f": {node_text(ret, source)}"
+                    append(make_symbol(
                         name=name,
                         kind="method",
                         line_start=child.start_point[0] + 1,
@@ -103,8 +120,8 @@ class TypeScriptExtractor(JavaScriptExtractor):
                     type_ann = child.child_by_field_name("type")
                     sig = name
                     if type_ann:
-                        sig += f": {self.node_text(type_ann, source)}"
-                    symbols.append(self._make_symbol(
+                        sig += f": {node_text(type_ann, source)}"
+                    append(make_symbol(
                         name=name,
                         kind="property",
                         line_start=child.start_point[0] + 1,
@@ -127,7 +144,8 @@ class TypeScriptExtractor(JavaScriptExtractor):
 
         value = node.child_by_field_name("value")
         if value:
-            val_text = self.node_text(value, source)
+            # One character past the limit tells whether it fits
+            val_text = self._text_prefix(value, source, 81)
             if len(val_text) <= 80:
                 sig += f" = {val_text}"
 
@@ -151,10 +169,12 @@ class TypeScriptExtractor(JavaScriptExtractor):
         name = self.node_text(name_node, source)
 
         # Check for const enum
+        body_node = node.child_by_field_name("body")
         is_const = any(
-            child.type == "const" or self.node_text(child, source) == "const"
+            child.end_byte - child.start_byte == 5
+            and source[child.start_byte:child.end_byte] == b"const"
             for child in node.children
-            if child != node.child_by_field_name("name") and child != node.child_by_field_name("body")
+            if child != name_node and child != body_node
         )
         sig = f"{'const ' if is_const else ''}enum {name}"
 
@@ -174,6 +194,7 @@ class TypeScriptExtractor(JavaScriptExtractor):
         # Extract enum members
         body = node.child_by_field_name("body")
         if body:
+            prefix = qualified + "."
             for child in body.children:
                 if child.type == "enum_assignment" or child.type == "property_identifier":
                     mem_name = None
@@ -189,7 +210,7 @@ class TypeScriptExtractor(JavaScriptExtractor):
                             kind="field",
                             line_start=child.start_point[0] + 1,
                             line_end=child.end_point[0] + 1,
-                            qualified_name=f"{qualified}.{mem_name}",
+                            qualified_name=prefix + mem_name,
                             parent_name=qualified,
                         ))
 
@@ -240,21 +261,29 @@ class TypeScriptExtractor(JavaScriptExtractor):
 
     def _extract_class_members(self, body_node, source, symbols, class_name):
         """Override to handle TS-specific class members."""
+        make_symbol = self._make_symbol
+        node_text = self.node_text
+        append = symbols.append
+        prefix = class_name + "."
         for child in body_node.children:
             if child.type in ("method_definition", "public_field_definition", "field_definition",
                               "method_signature", "property_signature"):
                 name_node = child.child_by_field_name("name")
                 if name_node is None:
                     continue
-                name = self.node_text(name_node, source)
-                qualified = f"{class_name}.{name}"
+                name = node_text(name_node, source)
+                qualified = prefix + name
 
                 # Determine visibility from access modifiers
                 visibility = "public"
                 for sub in child.children:
-                    text = self.node_text(sub, source)
-                    if text in ("private", "protected", "public"):
-                        visibility = text
+                    start = sub.start_byte
+                    end = sub.end_byte
+                    if end - start > _VISIBILITY_MODIFIER_MAX_LEN:
+                        continue
+                    text = source[start:end]
+                    if text in _VISIBILITY_MODIFIERS:
+                        visibility = text.decode()
                         break
 
                 if child.type in ("method_definition", "method_signature"):
@@ -262,7 +291,7 @@ class TypeScriptExtractor(JavaScriptExtractor):
                     sig = f"{name}({self._params_text(params, source)})"
                     ret = child.child_by_field_name("return_type")
                     if ret:
-                        sig += f": {self.node_text(ret, source)}"
+                        sig += f": {node_text(ret, source)}"
 
                     # Decorators
                     decorators = self._get_ts_decorators(child, source)
@@ -270,7 +299,7 @@ class TypeScriptExtractor(JavaScriptExtractor):
                         sig = "\n".join(decorators) + "\n" + sig
 
                     kind = "constructor" if name == "constructor" else "method"
-                    symbols.append(self._make_symbol(
+                    append(make_symbol(
                         name=name,
                         kind=kind,
                         line_start=child.start_point[0] + 1,
@@ -285,8 +314,8 @@ class TypeScriptExtractor(JavaScriptExtractor):
                     type_ann = child.child_by_field_name("type")
                     sig = name
                     if type_ann:
-                        sig += f": {self.node_text(type_ann, source)}"
-                    symbols.append(self._make_symbol(
+                        sig += f": {node_text(type_ann, source)}"
+                    append(make_symbol(
                         name=name,
                         kind="property",
                         line_start=child.start_point[0] + 1,
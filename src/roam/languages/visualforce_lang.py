@@ -27,10 +27,11 @@ References extracted:
 import re
 
 from .base import LanguageExtractor
+from .registry import xml_kind_id, xml_tag_kind_ids
 
 # Regex patterns for VF merge field expressions
-_VF_LABEL_RE = re.compile(r'\{\!\s*\$Label\.(\w+)')
-_VF_SETUP_RE = re.compile(r'\{\!\s*\$Setup\.(\w+)')
+# {!$Label.X} and {!$Setup.X}, matched in one pass
+_VF_GLOBAL_RE = re.compile(r'\{\!\s*\$(Label|Setup)\.(\w+)')
 _VF_FIELD_RE = re.compile(r'\{\!\s*(\w+)\.(\w+)')  # {!object.field}
 
 
@@ -47,158 +48,250 @@ class VisualforceExtractor(LanguageExtractor):
 
     def extract_symbols(self, tree, source: bytes, file_path: str) -> list[dict]:
         symbols: list[dict] = []
+        # The only symbol comes from an apex:page or apex:component tag
+        if b"apex:page" not in source and b"apex:component" not in source:
+            return symbols
         self._walk_symbols(tree.root_node, source, symbols, file_path)
         return symbols
 
     def extract_references(self, tree, source: bytes, file_path: str) -> list[dict]:
         refs: list[dict] = []
+        # Every reference comes from a namespaced tag or a merge field
+        if b":" not in source and b"{!" not in source:
+            return refs
         self._walk_refs(tree.root_node, source, refs, file_path)
-        return refs
+        # A label used twice in one tag, or a repeated extension, adds
+        # nothing to the graph; keep the first reference per target and line
+        seen: set[tuple[str, int, str]] = set()
+        unique: list[dict] = []
+        for ref in refs:
+            key = (ref["target_name"], ref["line"], ref["kind"])
+            if key not in seen:
+                seen.add(key)
+                unique.append(ref)
+        return unique
 
     # ------------------------------------------------------------------ #
     #  Symbol extraction                                                  #
     # ------------------------------------------------------------------ #
 
     def _walk_symbols(self, node, source, symbols, file_path):
-        if node.type == "element":
-            tag = self._get_tag(node, source)
-            if tag in ("apex:page", "apex:component"):
-                kind = "class"
-                comp_name = self._derive_name(file_path)
-                sig = f"{tag.split(':')[1]} {comp_name}"
-
-                attrs = self._get_attrs(node, source)
-                controller = attrs.get("controller")
-                if controller:
-                    sig += f" controller={controller}"
-                extensions = attrs.get("extensions")
-                if extensions:
-                    sig += f" extensions={extensions}"
-
-                symbols.append(self._make_symbol(
-                    name=comp_name,
-                    kind=kind,
-                    line_start=node.start_point[0] + 1,
-                    line_end=node.end_point[0] + 1,
-                    qualified_name=comp_name,
-                    signature=sig,
-                    visibility="public",
-                    is_exported=True,
-                ))
-                return
-
-        for child in node.children:
-            self._walk_symbols(child, source, symbols, file_path)
+        # Iterative pre-order walk with a TreeCursor.  Start and end tags
+        # never hold elements, and a page or component is not searched for
+        # nested ones, so neither is descended into.
+        cursor = node.walk()
+        element = xml_kind_id("element")
+        tag_kinds = xml_tag_kind_ids()
+        depth = 0
+        while True:
+            node = cursor.node
+            kind_id = node.kind_id
+            descend = kind_id not in tag_kinds
+            if kind_id == element:
+                start_tag = self._get_start_tag(node)
+                tag = self._get_tag(start_tag, source)
+                if tag in (b"apex:page", b"apex:component"):
+                    kind = "class"
+                    comp_name = self._derive_name(file_path)
+                    sig = f"{tag[5:].decode('ascii')} {comp_name}"
+
+                    attrs = self._get_attr(start_tag, source, {b"controller", b"extensions"})
+                    controller = attrs.get(b"controller")
+                    if controller:
+                        sig += f" controller={controller}"
+                    extensions = attrs.get(b"extensions")
+                    if extensions:
+                        sig += f" extensions={extensions}"
+
+                    symbols.append(self._make_symbol(
+                        name=comp_name,
+                        kind=kind,
+                        line_start=node.start_point[0] + 1,
+                        line_end=node.end_point[0] + 1,
+                        qualified_name=comp_name,
+                        signature=sig,
+                        visibility="public",
+                        is_exported=True,
+                    ))
+                    descend = False
+
+            if descend and cursor.goto_first_child():
+                depth += 1
+                continue
+            while not cursor.goto_next_sibling():
+                if depth == 0:
+                    return
+                cursor.goto_parent()
+                depth -= 1
 
     # ------------------------------------------------------------------ #
     #  Reference extraction                                               #
     # ------------------------------------------------------------------ #
 
     def _walk_refs(self, node, source, refs, file_path):
-        if node.type == "element":
-            tag = self._get_tag(node, source)
-            attrs = self._get_attrs(node, source)
-
-            if tag in ("apex:page", "apex:component"):
-                # controller="MyController"
-                controller = attrs.get("controller")
-                if controller:
-                    refs.append(self._make_reference(
-                        target_name=controller,
-                        kind="reference",
-                        line=node.start_point[0] + 1,
-                    ))
-                # extensions="ExtA,ExtB"
-                extensions = attrs.get("extensions")
-                if extensions:
-                    for ext in extensions.split(","):
-                        ext = ext.strip()
-                        if ext:
+        # Iterative pre-order walk with a TreeCursor; start and end tags
+        # never hold elements, so they are not descended into.
+        cursor = node.walk()
+        element = xml_kind_id("element")
+        tag_kinds = xml_tag_kind_ids()
+        depth = 0
+        while True:
+            node = cursor.node
+            kind_id = node.kind_id
+            if kind_id == element:
+                # The start tag is found once and shared by every lookup below
+                start_tag = self._get_start_tag(node)
+                tag = self._get_tag(start_tag, source)
+
+                # Every tag of interest is namespaced, so plain HTML tags
+                # need only the one check
+                if tag and b":" in tag:
+                    ns, comp = tag.split(b":", 1)
+                    if ns == b"apex":
+                        if comp in (b"page", b"component"):
+                            attrs = self._get_attr(
+                                start_tag, source, {b"controller", b"extensions"})
+                            # controller="MyController"
+                            controller = attrs.get(b"controller")
+                            if controller:
+                                refs.append(self._make_reference(
+                                    target_name=controller,
+                                    kind="reference",
+                                    line=node.start_point[0] + 1,
+                                ))
+                            # extensions="ExtA,ExtB"
+                            extensions = attrs.get(b"extensions")
+                            if extensions:
+                                for ext in extensions.split(","):
+                                    ext = ext.strip()
+                                    if ext:
+                                        refs.append(self._make_reference(
+                                            target_name=ext,
+                                            kind="reference",
+                                            line=node.start_point[0] + 1,
+                                        ))
+
+                        elif comp == b"include":
+                            attrs = self._get_attr(start_tag, source, {b"pageName"})
+                            page_name = attrs.get(b"pageName")
+                            if page_name:
+                                refs.append(self._make_reference(
+                                    target_name=page_name,
+                                    kind="reference",
+                                    line=node.start_point[0] + 1,
+                                ))
+
+                    # Custom component usage: <c:MyComponent> or <ns:MyComponent>
+                    else:
+                        comp = comp.decode("utf-8", errors="replace")
+                        if comp[0:1].isupper():
                             refs.append(self._make_reference(
-                                target_name=ext,
+                                target_name=comp,
                                 kind="reference",
                                 line=node.start_point[0] + 1,
                             ))
 
-            elif tag == "apex:include":
-                page_name = attrs.get("pageName")
-                if page_name:
-                    refs.append(self._make_reference(
-                        target_name=page_name,
-                        kind="reference",
-                        line=node.start_point[0] + 1,
-                    ))
-
-            # Custom component usage: <c:MyComponent> or <ns:MyComponent>
-            elif tag and ":" in tag:
-                ns, comp = tag.split(":", 1)
-                if ns != "apex" and comp[0:1].isupper():
-                    refs.append(self._make_reference(
-                        target_name=comp,
-                        kind="reference",
-                        line=node.start_point[0] + 1,
-                    ))
+                # Scan attribute values for merge field expressions
+                self._extract_merge_fields(node, start_tag, source, refs)
 
-        # Scan attribute values for merge field expressions
-        if node.type == "element":
-            self._extract_merge_fields(node, source, refs)
-
-        for child in node.children:
-            self._walk_refs(child, source, refs, file_path)
+            if kind_id not in tag_kinds and cursor.goto_first_child():
+                depth += 1
+                continue
+            while not cursor.goto_next_sibling():
+                if depth == 0:
+                    return
+                cursor.goto_parent()
+                depth -= 1
 
-    def _extract_merge_fields(self, node, source, refs):
-        """Extract references from VF merge field expressions in attribute values."""
-        attrs = self._get_attrs(node, source)
-        for val in attrs.values():
-            if "{!" not in val:
+    def _extract_merge_fields(self, node, start_tag, source, refs):
+        """Extract references from VF merge field expressions in *node*'s attribute values."""
+        # Most elements have no merge fields at all; check the start tag's
+        # raw text before walking its attributes
+        if start_tag is None or b"{!" not in source[start_tag.start_byte:start_tag.end_byte]:
+            return
+        # A repeated attribute keeps its last value, as in _get_attr
+        values = dict(self._iter_attrs(start_tag, source))
+        for value_node in values.values():
+            # Both kinds of global merge field start with "{!" and use "$";
+            # check before decoding, since most values have neither
+            raw = source[value_node.start_byte:value_node.end_byte]
+            if b"{!" not in raw or b"$" not in raw:
                 continue
+            val = self.node_text(value_node, source).strip('"\'')
             line = node.start_point[0] + 1
-            # {!$Label.MyLabel}
-            for m in _VF_LABEL_RE.finditer(val):
-                refs.append(self._make_reference(
-                    target_name=m.group(1),
-                    kind="reference",
-                    line=line,
-                ))
-            # {!$Setup.CustomSetting__c.Field}
-            for m in _VF_SETUP_RE.finditer(val):
-                refs.append(self._make_reference(
-                    target_name=m.group(1),
+            # {!$Label.MyLabel} and {!$Setup.CustomSetting__c.Field};
+            # labels are listed first, then settings
+            setup_refs = []
+            for m in _VF_GLOBAL_RE.finditer(val):
+                ref = self._make_reference(
+                    target_name=m.group(2),
                     kind="reference",
                     line=line,
-                ))
+                )
+                if m.group(1) == "Label":
+                    refs.append(ref)
+                else:
+                    setup_refs.append(ref)
+            refs.extend(setup_refs)
 
     # ------------------------------------------------------------------ #
     #  Helpers                                                            #
     # ------------------------------------------------------------------ #
 
-    def _get_tag(self, element_node, source: bytes) -> str | None:
-        """Get the full tag name from an element."""
+    def _get_start_tag(self, element_node):
+        """Get the start tag (STag or EmptyElemTag) node of an element."""
+        # The start tag comes first in an element; read it by position
+        tag = element_node.child(0)
+        if tag is not None and tag.kind_id in (xml_kind_id("STag"), xml_kind_id("EmptyElemTag")):
+            return tag
         for child in element_node.children:
             if child.type in ("STag", "EmptyElemTag"):
-                for sub in child.children:
-                    if sub.type == "Name":
-                        return self.node_text(sub, source)
+                return child
         return None
 
-    def _get_attrs(self, element_node, source: bytes) -> dict[str, str]:
-        """Get all attributes as a dict from an element's start tag."""
-        attrs: dict[str, str] = {}
-        for child in element_node.children:
-            if child.type in ("STag", "EmptyElemTag"):
-                for sub in child.children:
-                    if sub.type == "Attribute":
-                        name_node = None
-                        value_node = None
-                        for attr_child in sub.children:
-                            if attr_child.type == "Name":
-                                name_node = attr_child
-                            elif attr_child.type == "AttValue":
-                                value_node = attr_child
-                        if name_node and value_node:
-                            k = self.node_text(name_node, source)
-                            v = self.node_text(value_node, source).strip('"\'')
-                            attrs[k] = v
+    def _get_tag(self, start_tag, source: bytes) -> bytes | None:
+        """Get the full tag name from an element's start tag, as undecoded bytes.
+
+        Most tags are only compared against known names, so callers decode
+        the few they emit.
+        """
+        if start_tag is None:
+            return None
+        # The Name comes right after the "<"; read it by position
+        name = start_tag.child(1)
+        if name is not None and name.kind_id == xml_kind_id("Name"):
+            return source[name.start_byte:name.end_byte]
+        for sub in start_tag.children:
+            if sub.type == "Name":
+                return source[sub.start_byte:sub.end_byte]
+        return None
+
+    def _iter_attrs(self, start_tag, source: bytes):
+        """Yield ``(name, value_node)`` for each attribute in an element's start tag.
+
+        Names are raw bytes and values are left undecoded, so callers only
+        pay for the attributes they use.
+        """
+        if start_tag is None:
+            return
+        for sub in start_tag.children:
+            if sub.type == "Attribute":
+                name_node = None
+                value_node = None
+                for attr_child in sub.children:
+                    if attr_child.type == "Name":
+                        name_node = attr_child
+                    elif attr_child.type == "AttValue":
+                        value_node = attr_child
+                if name_node and value_node:
+                    yield source[name_node.start_byte:name_node.end_byte], value_node
+
+    def _get_attr(self, start_tag, source: bytes, wanted: set[bytes]) -> dict[bytes, str]:
+        """Get the *wanted* attributes from an element's start tag, keyed by raw name."""
+        attrs: dict[bytes, str] = {}
+        for k, value_node in self._iter_attrs(start_tag, source):
+            if k in wanted:
+                attrs[k] = self.node_text(value_node, source).strip('"\'')
         return attrs
 
     def _derive_name(self, file_path: str) -> str:
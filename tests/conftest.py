@@ -22,6 +22,26 @@ def roam(*args, cwd=None):
     return result.stdout + result.stderr, result.returncode
 
 
+def inproc_roam(*args, cwd=None):
+    """Run a roam CLI command in this process and return (output, returncode).
+
+    Same contract as roam(), without starting a new interpreter per call.
+    Meant for read-only queries; run ``roam index`` through roam() so that
+    indexing stays out of the test process.
+    """
+    from click.testing import CliRunner
+    from roam.cli import cli
+
+    old_cwd = os.getcwd()
+    if cwd is not None:
+        os.chdir(cwd)
+    try:
+        result = CliRunner().invoke(cli, list(args))
+    finally:
+        os.chdir(old_cwd)
+    return result.output, result.exit_code
+
+
 def git_init(path):
     """Initialize a git repo, add all files, and commit."""
     subprocess.run(["git", "init"], cwd=path, capture_output=True)
@@ -256,6 +256,38 @@ class TestIncrementalEdges:
         out, _ = roam("uses", "Base", cwd=python_project)
         assert "Child" in out, f"Edge lost after incremental re-index: {out}"
 
+    def test_edges_survive_without_stored_references(self, python_project):
+        """Unchanged files with no stored references are parsed again."""
+        import sqlite3
+
+        roam("index", "--force", cwd=python_project)
+        db_path = python_project / ".roam" / "index.db"
+        conn = sqlite3.connect(db_path)
+        try:
+            # As left by an index built before references were stored
+            conn.execute("DELETE FROM file_references")
+            conn.commit()
+        finally:
+            conn.close()
+
+        (python_project / "base.py").write_text(
+            'class Base:\n'
+            '    def hello(self):\n'
+            '        return "hello world"\n'
+        )
+        git_commit(python_project, "update base")
+        roam("index", cwd=python_project)
+
+        out, _ = roam("uses", "Base", cwd=python_project)
+        assert "Child" in out, f"Edge lost after incremental re-index: {out}"
+
+        conn = sqlite3.connect(db_path)
+        try:
+            stored = conn.execute("SELECT COUNT(*) FROM file_references").fetchone()[0]
+        finally:
+            conn.close()
+        assert stored == 2
+
 
 # ---- Fix 4: .roam/ exclusion ----
 
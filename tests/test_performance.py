@@ -132,6 +132,58 @@ class TestIndexingPerformance:
         assert "Re-extracting" in out
         assert elapsed < 5000, f"Single-file incremental took {elapsed:.0f}ms (limit 5000ms)"
 
+    def test_parallel_index_matches_serial(self, medium_project):
+        """Parsing in worker processes should store the same index."""
+        import sqlite3
+
+        def snapshot():
+            conn = sqlite3.connect(medium_project / ".roam" / "index.db")
+            try:
+                return [
+                    conn.execute(q).fetchall() for q in (
+                        "SELECT path, language, line_count FROM files ORDER BY id",
+                        "SELECT qualified_name, kind, line_start FROM symbols ORDER BY id",
+                        "SELECT source_id, target_id, kind FROM edges ORDER BY source_id, target_id, kind",
+                    )
+                ]
+            finally:
+                conn.close()
+
+        out, rc = roam("index", "--force", "--workers", "1", cwd=medium_project)
+        assert rc == 0, f"Serial index failed: {out}"
+        serial = snapshot()
+
+        out, rc = roam("index", "--force", "--workers", "3", cwd=medium_project)
+        assert rc == 0, f"Parallel index failed: {out}"
+        assert snapshot() == serial
+
+    def test_broken_pool_falls_back_to_serial(self, medium_project, monkeypatch):
+        """A pool that dies mid-run should leave the rest to the serial path."""
+        from concurrent.futures.process import BrokenProcessPool
+        from roam.index import indexer
+
+        class DyingPool:
+            def __init__(self, max_workers):
+                pass
+
+            def map(self, fn, *iterables, chunksize=1):
+                for i, args in enumerate(zip(*iterables)):
+                    if i == 2:
+                        raise BrokenProcessPool("worker died")
+                    yield fn(*args)
+
+            def shutdown(self, wait=True, cancel_futures=False):
+                pass
+
+        monkeypatch.setattr(indexer, "ProcessPoolExecutor", DyingPool)
+        paths = sorted(
+            p.relative_to(medium_project).as_posix()
+            for p in medium_project.rglob("*.py")
+        )[:5]
+        got = list(indexer._iter_extracted(medium_project, paths, 3, False))
+        assert [rel_path for rel_path, _ in got] == paths
+        assert all(extracted is not None for _, extracted in got)
+
 
 # ============================================================================
 # QUERY PERFORMANCE
@@ -347,6 +399,86 @@ class TestStress:
         out, _ = roam("deps", "hub.py", cwd=proj)
         assert "mod_0" in out or "helper_0" in out
 
+    def test_deeply_nested_js_calls(self):
+        """Call nesting deeper than the recursion limit should still extract."""
+        from tree_sitter_language_pack import get_parser
+        from roam.languages.javascript_lang import JavaScriptExtractor
+
+        depth = sys.getrecursionlimit() * 2
+        code = ("f(" * depth + "x" + ")" * depth).encode()
+        tree = get_parser("javascript").parse(code)
+        extractor = JavaScriptExtractor()
+        extractor.extract_symbols(tree, code, "nested.js")
+        refs = extractor.extract_references(tree, code, "nested.js")
+
+        assert sum(1 for r in refs if r["kind"] == "call") == depth
+
+    def test_ts_error_root_still_extracts(self):
+        """A file that parses to an ERROR root keeps its symbols and references."""
+        from tree_sitter_language_pack import get_parser
+        from roam.languages.typescript_lang import TypeScriptExtractor
+
+        code = (
+            b"export class Frame {\n"
+            b"  url(): string {\n"
+            b"    return parse(this.href);\n"
+            b"  }\n"
+            b"}\n"
+            b"let a = <T>(x) => { "
+        )
+        tree = get_parser("typescript").parse(code)
+        assert tree.root_node.type == "ERROR"
+        extractor = TypeScriptExtractor()
+        symbols = extractor.extract_symbols(tree, code, "frame.ts")
+        refs = extractor.extract_references(tree, code, "frame.ts")
+
+        assert {"Frame", "url"} <= {s["name"] for s in symbols}
+        assert any(r["kind"] == "call" and r["target_name"] == "parse" for r in refs)
+
+    def test_js_extractor_state_released_after_refs(self):
+        """extract_references drops the per-file state extract_symbols built."""
+        from tree_sitter_language_pack import get_parser
+        from roam.languages.javascript_lang import JavaScriptExtractor
+
+        code = b"class A extends B {}\nfunction f() {}\nmodule.exports = f;\n"
+        tree = get_parser("javascript").parse(code)
+        extractor = JavaScriptExtractor()
+        extractor.extract_symbols(tree, code, "a.js")
+        extractor.extract_references(tree, code, "a.js")
+
+        state = extractor._state
+        assert state.pending_inherits == []
+        assert state.symbols_by_name == {}
+        assert state.symbols_indexed == 0
+
+    def test_shared_js_extractor_across_threads(self):
+        """Threads sharing one JS extractor keep their inheritance refs apart."""
+        import threading
+        from tree_sitter_language_pack import get_parser
+        from roam.languages.registry import get_extractor
+
+        extractor = get_extractor("javascript")
+        n_threads = 4
+        barrier = threading.Barrier(n_threads)
+        results = {}
+
+        def work(i):
+            code = f"class C{i} extends Base{i} {{}}\n".encode()
+            tree = get_parser("javascript").parse(code)
+            extractor.extract_symbols(tree, code, f"c{i}.js")
+            # Every thread has extracted symbols before any takes its refs
+            barrier.wait()
+            refs = extractor.extract_references(tree, code, f"c{i}.js")
+            results[i] = [r["target_name"] for r in refs if r["kind"] == "inherits"]
+
+        threads = [threading.Thread(target=work, args=(i,)) for i in range(n_threads)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert results == {i: [f"Base{i}"] for i in range(n_threads)}
+
 
 # ============================================================================
 # CORRUPTED / UNUSUAL INDEX STATES
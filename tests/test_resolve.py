@@ -7,8 +7,10 @@ from pathlib import Path
 
 import pytest
 
-from tests.conftest import roam, git_init
-from roam.index.relations import _closest_symbol, _match_import_path, resolve_references
+from tests.conftest import roam, inproc_roam, git_init
+from roam.index.relations import (
+    _build_file_symbols, _closest_symbol, _match_import_path, resolve_references,
+)
 from roam.index.parser import extract_vue_template, scan_template_references
 
 
@@ -57,7 +59,7 @@ def resolve_project(tmp_path_factory):
 
 def test_find_symbol_unique(resolve_project):
     """find_symbol returns the symbol when there's exactly one match."""
-    out, rc = roam("symbol", "uniqueHelper", cwd=resolve_project)
+    out, rc = inproc_roam("symbol", "uniqueHelper", cwd=resolve_project)
     assert rc == 0
     assert "uniqueHelper" in out
 
@@ -66,7 +68,7 @@ def test_find_symbol_disambiguates_by_edges(resolve_project):
     """find_symbol picks the most-referenced symbol among duplicates."""
     # file_b.deleteRow is called by process() and cleanup(),
     # so it has the most incoming edges and should be picked
-    out, rc = roam("symbol", "deleteRow", cwd=resolve_project)
+    out, rc = inproc_roam("symbol", "deleteRow", cwd=resolve_project)
     assert rc == 0
     # Should resolve without error (no "Multiple matches" shown)
     assert "Multiple matches" not in out
@@ -76,7 +78,7 @@ def test_find_symbol_disambiguates_by_edges(resolve_project):
 
 def test_find_symbol_not_found(resolve_project):
     """find_symbol returns None (command exits 1) for nonexistent symbol."""
-    out, rc = roam("symbol", "nonExistentSymbol12345", cwd=resolve_project)
+    out, rc = inproc_roam("symbol", "nonExistentSymbol12345", cwd=resolve_project)
     assert rc != 0
     assert "not found" in out.lower()
 
@@ -84,21 +86,21 @@ def test_find_symbol_not_found(resolve_project):
 def test_file_hint_syntax(resolve_project):
     """file:symbol syntax narrows resolution to a specific file."""
     # This should resolve to file_b's deleteRow specifically
-    out, rc = roam("symbol", "file_b:deleteRow", cwd=resolve_project)
+    out, rc = inproc_roam("symbol", "file_b:deleteRow", cwd=resolve_project)
     assert rc == 0
     assert "file_b" in out
 
 
 def test_why_command_uses_resolve(resolve_project):
     """roam why should use shared find_symbol (no crash, proper resolution)."""
-    out, rc = roam("why", "deleteRow", cwd=resolve_project)
+    out, rc = inproc_roam("why", "deleteRow", cwd=resolve_project)
     assert rc == 0
     assert "ROLE" in out or "role" in out.lower() or "Leaf" in out or "fan-in" in out.lower()
 
 
 def test_impact_command_uses_resolve(resolve_project):
     """roam impact should use shared find_symbol (no ambiguous list crash)."""
-    out, rc = roam("impact", "deleteRow", cwd=resolve_project)
+    out, rc = inproc_roam("impact", "deleteRow", cwd=resolve_project)
     assert rc == 0
     # Should not show "Multiple matches" — resolve.py handles disambiguation
     assert "Multiple matches" not in out
@@ -106,14 +108,14 @@ def test_impact_command_uses_resolve(resolve_project):
 
 def test_safe_delete_command_uses_resolve(resolve_project):
     """roam safe-delete should use shared find_symbol."""
-    out, rc = roam("safe-delete", "uniqueHelper", cwd=resolve_project)
+    out, rc = inproc_roam("safe-delete", "uniqueHelper", cwd=resolve_project)
     assert rc == 0
     assert "SAFE" in out or "REVIEW" in out or "UNSAFE" in out
 
 
 def test_context_command_uses_resolve(resolve_project):
     """roam context should use shared find_symbol."""
-    out, rc = roam("context", "uniqueHelper", cwd=resolve_project)
+    out, rc = inproc_roam("context", "uniqueHelper", cwd=resolve_project)
     assert rc == 0
     assert "utils.py" in out
 
@@ -127,7 +129,7 @@ class TestClosestSymbol:
         """Build file_symbols dict from list of (name, line_start, line_end) tuples."""
         syms = [{"name": n, "line_start": ls, "line_end": le, "id": i}
                 for i, (n, ls, le) in enumerate(symbols_data)]
-        return {"test.vue": syms}
+        return {"test.vue": ([s["line_start"] for s in syms], syms)}
 
     def test_picks_enclosing_function(self):
         """Reference at line 25 should resolve to funcB (line 20-35), not funcA (line 5-15)."""
@@ -189,54 +191,227 @@ class TestClosestSymbol:
         assert result["name"] == "funcA"
 
 
+@pytest.fixture(scope="module")
+def integration_project(tmp_path_factory):
+    """Create and index one project holding every integration scenario.
+
+    Each scenario lives in its own subdirectory, so the project is indexed
+    once for the whole module.  Symbol names are unique across scenarios
+    except where a test passes a file hint.
+    """
+    root = tmp_path_factory.mktemp("integration_project")
+
+    # Functions at known lines
+    line_start = root / "line_start"
+    line_start.mkdir()
+    (line_start / "example.py").write_text(
+        "def first_func():\n"     # line 1
+        "    pass\n"
+        "\n"
+        "def second_func():\n"    # line 4
+        "    first_func()\n"
+    )
+
+    # Vue template calls handleClick defined in script
+    vue_line_start = root / "vue_line_start"
+    vue_line_start.mkdir()
+    (vue_line_start / "App.vue").write_text(
+        '<template>\n'
+        '  <button @click="handleClick">Click</button>\n'
+        '</template>\n'
+        '<script setup lang="ts">\n'
+        'function handleClick() {\n'
+        '  console.log("clicked")\n'
+        '}\n'
+        '</script>\n'
+    )
+
+    # Vue handler used after a nested <template #slot>
+    nested_template = root / "nested_template"
+    nested_template.mkdir()
+    (nested_template / "Modal.vue").write_text(
+        '<template>\n'
+        '  <div>\n'
+        '    <template #header>\n'
+        '      <h1>Title</h1>\n'
+        '    </template>\n'
+        '    <button @click="handleSubmit">Submit</button>\n'
+        '  </div>\n'
+        '</template>\n'
+        '<script setup lang="ts">\n'
+        'function handleSubmit() {\n'
+        '  console.log("submitted")\n'
+        '}\n'
+        '</script>\n'
+    )
+
+    # Two files define formatValue; the consumer imports one
+    import_resolve = root / "import_resolve"
+    import_resolve.mkdir()
+    src = import_resolve / "src"
+    src.mkdir()
+    composables = src / "composables"
+    composables.mkdir()
+
+    # Definition A: the "correct" one (exported from composables)
+    (composables / "helpers.py").write_text(
+        "def formatValue(x):\n"
+        "    '''Format a value.'''\n"
+        "    return str(x)\n"
+    )
+
+    # Definition B: a different file also defines formatValue
+    (src / "utils.py").write_text(
+        "def formatValue(x):\n"
+        "    '''Different formatValue.'''\n"
+        "    return repr(x)\n"
+    )
+
+    # Consumer: imports from composables
+    (src / "consumer.py").write_text(
+        "from composables.helpers import formatValue\n\n"
+        "def process():\n"
+        "    formatValue(42)\n"
+    )
+
+    # Python from-import of a name defined in two modules
+    py_import = root / "py_import"
+    py_import.mkdir()
+    (py_import / "module_a.py").write_text(
+        "def sharedFunc():\n"
+        "    return 'A'\n"
+    )
+    (py_import / "module_b.py").write_text(
+        "def sharedFunc():\n"
+        "    return 'B'\n"
+    )
+    (py_import / "main.py").write_text(
+        "from module_a import sharedFunc\n\n"
+        "def run():\n"
+        "    sharedFunc()\n"
+    )
+
+    # Vue :class binding spanning several lines
+    multiline_vue = root / "multiline_vue"
+    multiline_vue.mkdir()
+    (multiline_vue / "App.vue").write_text(
+        '<template>\n'
+        '  <div\n'
+        '    :class="cn(\n'
+        '      isActive(item) && \'font-bold\',\n'
+        '      \'p-2\'\n'
+        '    )"\n'
+        '  >\n'
+        '    {{ label }}\n'
+        '  </div>\n'
+        '</template>\n'
+        '<script setup lang="ts">\n'
+        'function cn(...args: any[]) { return args.filter(Boolean).join(" ") }\n'
+        'function isActive(item: any) { return item.active }\n'
+        'const label = "hello"\n'
+        '</script>\n'
+    )
+
+    # Function passed as a callback argument
+    callback_ref = root / "callback_ref"
+    callback_ref.mkdir()
+    (callback_ref / "app.js").write_text(
+        'function handler() {\n'
+        '  console.log("handled")\n'
+        '}\n'
+        '\n'
+        'function setup() {\n'
+        '  document.addEventListener("click", handler)\n'
+        '}\n'
+    )
+
+    # Callback passed to setTimeout
+    nested_cb = root / "nested_cb"
+    nested_cb.mkdir()
+    (nested_cb / "app.js").write_text(
+        'function doWork() {\n'
+        '  return 42\n'
+        '}\n'
+        '\n'
+        'function init() {\n'
+        '  setTimeout(doWork, 100)\n'
+        '}\n'
+    )
+
+    # Shorthand properties in defineExpose
+    shorthand_prop = root / "shorthand_prop"
+    shorthand_prop.mkdir()
+    (shorthand_prop / "Component.vue").write_text(
+        '<template>\n'
+        '  <div>Test</div>\n'
+        '</template>\n'
+        '<script setup lang="ts">\n'
+        'function fn1() { return 1 }\n'
+        'function fn2() { return 2 }\n'
+        'defineExpose({ fn1, fn2 })\n'
+        '</script>\n'
+    )
+
+    # Shorthand property next to a key: call() pair
+    shorthand_vs_pair = root / "shorthand_vs_pair"
+    shorthand_vs_pair.mkdir()
+    (shorthand_vs_pair / "app.js").write_text(
+        'function fn1() { return 1 }\n'
+        'function fn2() { return 2 }\n'
+        '\n'
+        'function setup() {\n'
+        '  const obj = { fn1, key: fn2() }\n'
+        '  return obj\n'
+        '}\n'
+    )
+
+    # Event listener callback registered in onMounted
+    callback_edge = root / "callback_edge"
+    callback_edge.mkdir()
+    (callback_edge / "Component.vue").write_text(
+        '<template>\n'
+        '  <div>Test</div>\n'
+        '</template>\n'
+        '<script setup lang="ts">\n'
+        'import { onMounted, onUnmounted } from "vue"\n'
+        '\n'
+        'function handleKeyboard(e: KeyboardEvent) {\n'
+        '  console.log(e.key)\n'
+        '}\n'
+        '\n'
+        'onMounted(() => {\n'
+        '  document.addEventListener("keydown", handleKeyboard)\n'
+        '})\n'
+        'onUnmounted(() => {\n'
+        '  document.removeEventListener("keydown", handleKeyboard)\n'
+        '})\n'
+        '</script>\n'
+    )
+
+    git_init(root)
+    out, rc = roam("index", cwd=root)
+    assert rc == 0, f"Index failed: {out}"
+    return root
+
+
 class TestIndexerLineStart:
     """Verify the indexer populates line_start in all_symbol_rows."""
 
-    def test_line_start_in_index(self, tmp_path):
+    def test_line_start_in_index(self, integration_project):
         """After indexing, symbols in DB should have real line_start values."""
-        root = tmp_path / "linestart_project"
-        root.mkdir()
-        (root / "example.py").write_text(
-            "def first_func():\n"     # line 1
-            "    pass\n"
-            "\n"
-            "def second_func():\n"    # line 4
-            "    first_func()\n"
-        )
-        git_init(root)
-        out, rc = roam("index", cwd=root)
-        assert rc == 0, f"Index failed: {out}"
-
         # Verify via roam symbol that line numbers are correct
-        out, rc = roam("symbol", "first_func", cwd=root)
+        out, rc = inproc_roam("symbol", "first_func", cwd=integration_project)
         assert rc == 0
         assert ":1" in out  # first_func at line 1
 
-        out, rc = roam("symbol", "second_func", cwd=root)
+        out, rc = inproc_roam("symbol", "second_func", cwd=integration_project)
         assert rc == 0
         assert ":4" in out  # second_func at line 4
 
-    def test_template_ref_gets_correct_source(self, tmp_path):
+    def test_template_ref_gets_correct_source(self, integration_project):
         """Vue template reference should resolve to correct enclosing function."""
-        root = tmp_path / "vue_linestart"
-        root.mkdir()
-        # Vue file where template calls handleClick defined in script
-        (root / "App.vue").write_text(
-            '<template>\n'
-            '  <button @click="handleClick">Click</button>\n'
-            '</template>\n'
-            '<script setup lang="ts">\n'
-            'function handleClick() {\n'
-            '  console.log("clicked")\n'
-            '}\n'
-            '</script>\n'
-        )
-        git_init(root)
-        out, rc = roam("index", cwd=root)
-        assert rc == 0, f"Index failed: {out}"
-
         # handleClick should have at least 1 caller (template edge)
-        out, rc = roam("symbol", "handleClick", cwd=root)
+        out, rc = inproc_roam("symbol", "handleClick", cwd=integration_project)
         assert rc == 0
         # With line_start fix, the template edge should be correctly attributed
         # (not a self-reference that gets skipped)
@@ -326,30 +501,9 @@ class TestExtractVueTemplate:
         content, _ = result
         assert "Still here" in content
 
-    def test_template_handlers_after_nested_slot(self, tmp_path):
+    def test_template_handlers_after_nested_slot(self, integration_project):
         """Integration: Vue file with nested slot, handler after inner </template> has fan-in > 0."""
-        root = tmp_path / "nested_template"
-        root.mkdir()
-        (root / "Modal.vue").write_text(
-            '<template>\n'
-            '  <div>\n'
-            '    <template #header>\n'
-            '      <h1>Title</h1>\n'
-            '    </template>\n'
-            '    <button @click="handleSubmit">Submit</button>\n'
-            '  </div>\n'
-            '</template>\n'
-            '<script setup lang="ts">\n'
-            'function handleSubmit() {\n'
-            '  console.log("submitted")\n'
-            '}\n'
-            '</script>\n'
-        )
-        git_init(root)
-        out, rc = roam("index", cwd=root)
-        assert rc == 0, f"Index failed: {out}"
-
-        out, rc = roam("symbol", "handleSubmit", cwd=root)
+        out, rc = inproc_roam("symbol", "handleSubmit", cwd=integration_project)
         assert rc == 0
         assert "handleSubmit" in out
 
@@ -414,69 +568,16 @@ class TestMatchImportPath:
 class TestImportAwareResolution:
     """Integration tests for import-aware symbol resolution."""
 
-    def test_import_prefers_correct_definition(self, tmp_path):
+    def test_import_prefers_correct_definition(self, integration_project):
         """Two files define same function, consumer imports from one — edge points to imported definition."""
-        root = tmp_path / "import_resolve"
-        root.mkdir()
-        src = root / "src"
-        src.mkdir()
-        composables = src / "composables"
-        composables.mkdir()
-
-        # Definition A: the "correct" one (exported from composables)
-        (composables / "helpers.py").write_text(
-            "def formatValue(x):\n"
-            "    '''Format a value.'''\n"
-            "    return str(x)\n"
-        )
-
-        # Definition B: a different file also defines formatValue
-        (src / "utils.py").write_text(
-            "def formatValue(x):\n"
-            "    '''Different formatValue.'''\n"
-            "    return repr(x)\n"
-        )
-
-        # Consumer: imports from composables
-        (src / "consumer.py").write_text(
-            "from composables.helpers import formatValue\n\n"
-            "def process():\n"
-            "    formatValue(42)\n"
-        )
-
-        git_init(root)
-        out, rc = roam("index", cwd=root)
-        assert rc == 0, f"Index failed: {out}"
-
         # The edge from process→formatValue should point to composables/helpers.py
-        out, rc = roam("symbol", "process", cwd=root)
+        out, rc = inproc_roam("symbol", "process", cwd=integration_project)
         assert rc == 0
 
-    def test_python_from_import_resolution(self, tmp_path):
+    def test_python_from_import_resolution(self, integration_project):
         """Python 'from X import Y' should resolve to correct file."""
-        root = tmp_path / "py_import"
-        root.mkdir()
-
-        (root / "module_a.py").write_text(
-            "def sharedFunc():\n"
-            "    return 'A'\n"
-        )
-        (root / "module_b.py").write_text(
-            "def sharedFunc():\n"
-            "    return 'B'\n"
-        )
-        (root / "main.py").write_text(
-            "from module_a import sharedFunc\n\n"
-            "def run():\n"
-            "    sharedFunc()\n"
-        )
-
-        git_init(root)
-        out, rc = roam("index", cwd=root)
-        assert rc == 0, f"Index failed: {out}"
-
         # Verify run() resolves — should not crash or pick wrong file
-        out, rc = roam("symbol", "run", cwd=root)
+        out, rc = inproc_roam("symbol", "run", cwd=integration_project)
         assert rc == 0
         assert "run" in out
 
@@ -538,32 +639,9 @@ class TestMultilineTemplateAttributes:
         # The :class binding starts at line 12 (offset 2 from start_line 10)
         assert refs[0]["line"] == 12
 
-    def test_vue_multiline_binding_integration(self, tmp_path):
+    def test_vue_multiline_binding_integration(self, integration_project):
         """Integration: Vue file with multi-line :class, verify fan-in > 0."""
-        root = tmp_path / "multiline_vue"
-        root.mkdir()
-        (root / "App.vue").write_text(
-            '<template>\n'
-            '  <div\n'
-            '    :class="cn(\n'
-            '      isActive(item) && \'font-bold\',\n'
-            '      \'p-2\'\n'
-            '    )"\n'
-            '  >\n'
-            '    {{ label }}\n'
-            '  </div>\n'
-            '</template>\n'
-            '<script setup lang="ts">\n'
-            'function cn(...args: any[]) { return args.filter(Boolean).join(" ") }\n'
-            'function isActive(item: any) { return item.active }\n'
-            'const label = "hello"\n'
-            '</script>\n'
-        )
-        git_init(root)
-        out, rc = roam("index", cwd=root)
-        assert rc == 0, f"Index failed: {out}"
-
-        out, rc = roam("symbol", "isActive", cwd=root)
+        out, rc = inproc_roam("symbol", "isActive", cwd=integration_project)
         assert rc == 0
         assert "isActive" in out
 
@@ -573,46 +651,16 @@ class TestMultilineTemplateAttributes:
 class TestIdentifierInArguments:
     """Verify identifiers passed as function arguments are extracted as references."""
 
-    def test_callback_identifier_extracted(self, tmp_path):
+    def test_callback_identifier_extracted(self, integration_project):
         """addEventListener('click', handler) → handler is a reference."""
-        root = tmp_path / "callback_ref"
-        root.mkdir()
-        (root / "app.js").write_text(
-            'function handler() {\n'
-            '  console.log("handled")\n'
-            '}\n'
-            '\n'
-            'function setup() {\n'
-            '  document.addEventListener("click", handler)\n'
-            '}\n'
-        )
-        git_init(root)
-        out, rc = roam("index", cwd=root)
-        assert rc == 0, f"Index failed: {out}"
-
-        out, rc = roam("symbol", "handler", cwd=root)
+        out, rc = inproc_roam("symbol", "handler", cwd=integration_project)
         assert rc == 0
         # handler should have fan-in > 0 (called from setup via addEventListener)
         assert "handler" in out
 
-    def test_nested_callback_not_duplicated(self, tmp_path):
+    def test_nested_callback_not_duplicated(self, integration_project):
         """setTimeout(doWork, 100) → doWork extracted once, not duplicated."""
-        root = tmp_path / "nested_cb"
-        root.mkdir()
-        (root / "app.js").write_text(
-            'function doWork() {\n'
-            '  return 42\n'
-            '}\n'
-            '\n'
-            'function init() {\n'
-            '  setTimeout(doWork, 100)\n'
-            '}\n'
-        )
-        git_init(root)
-        out, rc = roam("index", cwd=root)
-        assert rc == 0, f"Index failed: {out}"
-
-        out, rc = roam("symbol", "doWork", cwd=root)
+        out, rc = inproc_roam("symbol", "doWork", cwd=integration_project)
         assert rc == 0
         assert "doWork" in out
 
@@ -622,53 +670,55 @@ class TestIdentifierInArguments:
 class TestShorthandPropertyIdentifier:
     """Verify shorthand properties in objects are extracted as references."""
 
-    def test_shorthand_property_extracted(self, tmp_path):
+    def test_shorthand_property_extracted(self, integration_project):
         """defineExpose({ fn1, fn2 }) → both are references."""
-        root = tmp_path / "shorthand_prop"
-        root.mkdir()
-        (root / "Component.vue").write_text(
-            '<template>\n'
-            '  <div>Test</div>\n'
-            '</template>\n'
-            '<script setup lang="ts">\n'
-            'function fn1() { return 1 }\n'
-            'function fn2() { return 2 }\n'
-            'defineExpose({ fn1, fn2 })\n'
-            '</script>\n'
-        )
-        git_init(root)
-        out, rc = roam("index", cwd=root)
-        assert rc == 0, f"Index failed: {out}"
-
         # fn1 and fn2 should have references from defineExpose
-        out1, rc1 = roam("symbol", "fn1", cwd=root)
+        out1, rc1 = inproc_roam("symbol", "shorthand_prop:fn1", cwd=integration_project)
         assert rc1 == 0
-        out2, rc2 = roam("symbol", "fn2", cwd=root)
+        out2, rc2 = inproc_roam("symbol", "shorthand_prop:fn2", cwd=integration_project)
         assert rc2 == 0
 
-    def test_shorthand_vs_pair(self, tmp_path):
+    def test_shorthand_vs_pair(self, integration_project):
         """{ fn1, key: fn2() } → fn1 from shorthand, fn2 from call."""
-        root = tmp_path / "shorthand_vs_pair"
-        root.mkdir()
-        (root / "app.js").write_text(
-            'function fn1() { return 1 }\n'
-            'function fn2() { return 2 }\n'
-            '\n'
-            'function setup() {\n'
-            '  const obj = { fn1, key: fn2() }\n'
-            '  return obj\n'
-            '}\n'
-        )
-        git_init(root)
-        out, rc = roam("index", cwd=root)
-        assert rc == 0, f"Index failed: {out}"
-
-        out, rc = roam("symbol", "fn1", cwd=root)
+        out, rc = inproc_roam("symbol", "shorthand_vs_pair:fn1", cwd=integration_project)
         assert rc == 0
 
 
 # ---- Bug 4 (v4.3.1): _closest_symbol with line_end tests ----
 
+class TestClosestSymbolIndexerRows:
+    """_closest_symbol over rows shaped like the indexer's all_symbol_rows."""
+
+    def _indexer_rows(self, n):
+        # Same keys as Indexer.run's all_symbol_rows: line_start, no line_end
+        return [
+            {"id": i, "file_id": 1, "file_path": "big.py", "name": f"f{i}",
+             "qualified_name": f"f{i}", "kind": "function",
+             "is_exported": True, "line_start": 10 * i + 1}
+            for i in range(n)
+        ]
+
+    def test_rows_without_line_end_skip_the_scan(self):
+        rows = self._indexer_rows(50)
+        file_symbols = _build_file_symbols({r["name"]: [r] for r in rows})
+        line_starts, syms = file_symbols["big.py"]
+        # No symbol can contain a reference, so there is nothing to bisect
+        assert line_starts == []
+        assert _closest_symbol("big.py", 455, file_symbols) is syms[0]
+
+    def test_resolves_from_first_symbol(self):
+        rows = self._indexer_rows(50)
+        target = {"id": 100, "file_id": 2, "file_path": "lib.py", "name": "helper",
+                  "qualified_name": "helper", "kind": "function",
+                  "is_exported": True, "line_start": 1}
+        symbols_by_name = {r["name"]: [r] for r in rows}
+        symbols_by_name["helper"] = [target]
+        references = [{"source_name": None, "target_name": "helper", "kind": "call",
+                       "line": 455, "source_file": "big.py"}]
+        edges = resolve_references(references, symbols_by_name, {"big.py": 1, "lib.py": 2})
+        assert [(e["source_id"], e["target_id"]) for e in edges] == [(0, 100)]
+
+
 class TestClosestSymbolLineEnd:
     """Verify _closest_symbol uses line_end for containment checks."""
 
@@ -676,7 +726,7 @@ class TestClosestSymbolLineEnd:
         """Build file_symbols dict from list of (name, line_start, line_end) tuples."""
         syms = [{"name": n, "line_start": ls, "line_end": le, "id": i}
                 for i, (n, ls, le) in enumerate(symbols_data)]
-        return {"test.vue": syms}
+        return {"test.vue": ([s["line_start"] for s in syms], syms)}
 
     def test_ref_after_function_end_not_self(self):
         """Ref at L100, function ends at L80 → should NOT return that function."""
@@ -740,34 +790,9 @@ class TestClosestSymbolLineEnd:
 class TestCallbackArgumentEdge:
     """Integration test: callback passed by reference creates a graph edge."""
 
-    def test_event_listener_callback_has_edge(self, tmp_path):
+    def test_event_listener_callback_has_edge(self, integration_project):
         """onMounted with addEventListener('x', handler) → handler has fan-in > 0."""
-        root = tmp_path / "callback_edge"
-        root.mkdir()
-        (root / "Component.vue").write_text(
-            '<template>\n'
-            '  <div>Test</div>\n'
-            '</template>\n'
-            '<script setup lang="ts">\n'
-            'import { onMounted, onUnmounted } from "vue"\n'
-            '\n'
-            'function handleKeyboard(e: KeyboardEvent) {\n'
-            '  console.log(e.key)\n'
-            '}\n'
-            '\n'
-            'onMounted(() => {\n'
-            '  document.addEventListener("keydown", handleKeyboard)\n'
-            '})\n'
-            'onUnmounted(() => {\n'
-            '  document.removeEventListener("keydown", handleKeyboard)\n'
-            '})\n'
-            '</script>\n'
-        )
-        git_init(root)
-        out, rc = roam("index", cwd=root)
-        assert rc == 0, f"Index failed: {out}"
-
-        out, rc = roam("symbol", "handleKeyboard", cwd=root)
+        out, rc = inproc_roam("symbol", "handleKeyboard", cwd=integration_project)
         assert rc == 0
         assert "handleKeyboard" in out
 
@@ -1031,6 +1031,19 @@ class TestAuraComponentExtraction:
         method = next(s for s in symbols if s["name"] == "refresh")
         assert method["kind"] == "method"
 
+    def test_attribute_default_inner_quotes_kept(self, aura_extractor, xml_parser):
+        tree, source = _parse_xml(xml_parser, """<aura:component>
+    <aura:attribute name="single" type="String" default="'x'"/>
+    <aura:attribute name="double" type="String" default='"y"'/>
+</aura:component>
+""")
+        symbols = aura_extractor.extract_symbols(tree, source, "Quoted.cmp")
+        single = next(s for s in symbols if s["name"] == "single")
+        double = next(s for s in symbols if s["name"] == "double")
+        # Only the AttValue's own quote pair is removed
+        assert single["signature"].endswith(" = 'x'")
+        assert double["signature"].endswith(' = "y"')
+
     def test_component_references(self, aura_extractor, xml_parser):
         tree, source = _parse_xml(xml_parser, """<aura:component controller="AccountController" extends="c:BaseComponent" implements="force:appHostable,flexipage:availableForAllPageTypes">
     <aura:handler event="c:AccountUpdated" action="{!c.handleUpdate}"/>
@@ -1134,6 +1147,18 @@ class TestVisualforceExtraction:
         targets = {r["target_name"] for r in refs}
         assert "WidgetController" in targets
 
+    def test_vf_repeated_refs_deduplicated(self, vf_extractor, xml_parser):
+        tree, source = _parse_xml(xml_parser, """<apex:page controller="PageCtrl" extensions="ExtA, ExtA">
+    <apex:outputText value="{!$Label.Greeting} {!$Label.Greeting}"/>
+    <apex:outputText value="{!$Label.Greeting}"/>
+</apex:page>
+""")
+        refs = vf_extractor.extract_references(tree, source, "TestPage.page")
+        pairs = [(r["target_name"], r["line"]) for r in refs]
+        assert pairs.count(("ExtA", 1)) == 1
+        assert pairs.count(("Greeting", 2)) == 1
+        assert pairs.count(("Greeting", 3)) == 1
+
 
 # ============================================================================
 # Phase 4: Language detection and path heuristic tests
@@ -1480,6 +1505,17 @@ class TestAuraEdgeCases:
         comp_refs = [r for r in refs if r["target_name"] == "lowerCase"]
         assert len(comp_refs) == 0
 
+    def test_non_ascii_component_name(self, xml_parser):
+        """Non-ASCII tag names decode as UTF-8 instead of being mangled."""
+        from roam.languages.aura_lang import AuraExtractor
+        ext = AuraExtractor()
+        tree, source = _parse_xml(xml_parser, """<aura:component>
+    <c:Bütton label="x"/>
+</aura:component>
+""")
+        refs = ext.extract_references(tree, source, "Test.cmp")
+        assert "Bütton" in [r["target_name"] for r in refs]
+
     def test_controller_case_insensitive(self, xml_parser):
         """Controller= (capital C) should be resolved the same as controller=."""
         from roam.languages.aura_lang import AuraExtractor
@@ -1492,6 +1528,22 @@ class TestAuraEdgeCases:
         targets = {r["target_name"] for r in refs}
         assert "BasketController" in targets
 
+    def test_members_only_from_root_children(self, xml_parser):
+        """Member tags nested inside body markup are not component members."""
+        from roam.languages.aura_lang import AuraExtractor
+        ext = AuraExtractor()
+        tree, source = _parse_xml(xml_parser, """<aura:component>
+    <aura:attribute name="top" type="String"/>
+    <div>
+        <aura:attribute name="nested" type="String"/>
+    </div>
+</aura:component>
+""")
+        symbols = ext.extract_symbols(tree, source, "Body.cmp")
+        names = {s["name"] for s in symbols}
+        assert "top" in names
+        assert "nested" not in names
+
 
 class TestVisualforceEdgeCases:
     """Test Visualforce extractor edge cases."""